@@ -13,6 +13,7 @@ from logging.handlers import RotatingFileHandler
 from threading import Lock
 from dataclasses import dataclass
 from enum import Enum
+from functools import cached_property
 
 from ..settings import (
     LOGS_PATH, LOG_CONFIG, APP_NAME
@@ -36,7 +37,7 @@ class LogEntry:
     source: str
     message: str
     
-    @property
+    @cached_property
     def formatted_time(self) -> str:
         return datetime.fromtimestamp(self.timestamp).strftime("%H:%M:%S")
     
@@ -265,8 +265,9 @@ class Session:
     
     def _emit(self, event_type: EventType, data: dict):
         """Emit an event to all subscribers"""
-        if event_type in self._subscribers:
-            for callback in self._subscribers[event_type]:
+        callbacks = self._subscribers.get(event_type)
+        if callbacks:
+            for callback in callbacks:
                 try:
                     callback(event_type, data)
                 except Exception as e:
@@ -374,11 +374,11 @@ class LinuxWiFiDriver(WiFiDriverBase):
         
         return NetworkInfo(
             ssid=data.get('ssid', '<Hidden>'),
-            bssid=data.get('bssid', '00:00:00:00:00:00'),
+            bssid=data.get('bssid', '00:00:00:00:00:00').upper().replace('-', ':'),
             signal=data.get('signal', -80),
             channel=channel,
             frequency=frequency,
-            security=data.get('security', 'Open'),
+            security=data.get('security', 'Open').upper(),
             encryption=data.get('encryption', ''),
             hidden=data.get('hidden', False),
             wps=data.get('wps', False),
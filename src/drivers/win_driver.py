@@ -230,11 +230,11 @@ class WindowsWiFiDriver(WiFiDriverBase):
         
         return NetworkInfo(
             ssid=data.get('ssid', '<Hidden>'),
-            bssid=data.get('bssid', '00:00:00:00:00:00'),
+            bssid=data.get('bssid', '00:00:00:00:00:00').upper().replace('-', ':'),
             signal=data.get('signal', -80),
             channel=channel,
             frequency=frequency,
-            security=data.get('security', 'Unknown'),
+            security=data.get('security', 'Unknown').upper(),
             encryption=data.get('encryption', ''),
             hidden=data.get('ssid', '') == '<Hidden>',
             first_seen=time.time(),
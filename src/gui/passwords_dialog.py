@@ -142,9 +142,9 @@ class PasswordRow(ctk.CTkFrame):
                 self._copy_btn.configure(text="✓")
                 self.after(1000, lambda: self._copy_btn.configure(text=original_text))
             except Exception as e:
-                show_message("Error", f"Could not copy to clipboard: {e}", "error")
+                show_message("Error", f"Could not copy to clipboard: {e}", "error", parent=self.winfo_toplevel())
         else:
-            show_message("Info", "No password to copy", "info")
+            show_message("Info", "No password to copy", "info", parent=self.winfo_toplevel())
     
     def _test_connection(self):
         """Test connection to this WiFi network"""
@@ -199,7 +199,7 @@ class PasswordRow(ctk.CTkFrame):
         
         # Show message
         msg_type = "info" if success else "warning"
-        show_message("Connection Test", message, msg_type)
+        show_message("Connection Test", message, msg_type, parent=self.winfo_toplevel())
         
         # Restore original icon after delay
         self.after(2000, lambda: self._test_btn.configure(text="🔗"))
@@ -425,7 +425,7 @@ class SavedPasswordsDialog(ctk.CTkToplevel):
     def _export_passwords(self):
         """Export all passwords to a file"""
         if not self._passwords:
-            show_message("Info", "No passwords to export", "info")
+            show_message("Info", "No passwords to export", "info", parent=self)
             return
         
         try:
@@ -447,10 +447,10 @@ class SavedPasswordsDialog(ctk.CTkToplevel):
                         f.write(f"Password: {password or '(no password)'}\n")
                         f.write("-" * 30 + "\n")
                 
-                show_message("Success", f"Passwords exported to:\n{filepath}", "info")
+                show_message("Success", f"Passwords exported to:\n{filepath}", "info", parent=self)
         
         except Exception as e:
-            show_message("Error", f"Export failed: {e}", "error")
+            show_message("Error", f"Export failed: {e}", "error", parent=self)
 
 
 __all__ = ['SavedPasswordsDialog', 'PasswordRow']
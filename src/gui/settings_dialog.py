@@ -388,13 +388,13 @@ class SettingsDialog(ctk.CTkToplevel):
             
         except ValueError as e:
             from .utils import show_message
-            show_message("Error", f"Invalid value: {e}", "error")
+            show_message("Error", f"Invalid value: {e}", "error", parent=self)
     
     def _reset_settings(self):
         """Reset to default settings"""
         from .utils import ask_confirmation
         
-        if ask_confirmation("Reset Settings", "Reset all settings to default?"):
+        if ask_confirmation("Reset Settings", "Reset all settings to default?", parent=self):
             # Reset to defaults
             self._timeout_var.set("15")
             self._hidden_var.set(True)
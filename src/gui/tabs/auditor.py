@@ -3,13 +3,16 @@ WiFi Tester Pro v6.0 - Auditor Tab
 Security auditing and vulnerability assessment page
 """
 
+import os
+import queue
+import threading
 import customtkinter as ctk
-from typing import Optional
-import time
+from typing import Optional, List
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from ...settings import Colors, Fonts, Layout, NetworkInfo, IS_KALI
+from ...settings import Colors, Fonts, NetworkInfo, IS_KALI
 from ...security.common import SecurityScanner, VulnerabilityReport, VulnerabilitySeverity
-from ..utils import create_button, create_label, create_card
+from ..utils import create_button, create_label, show_message
 
 
 class VulnerabilityRow(ctk.CTkFrame):
@@ -121,6 +124,14 @@ class AuditorTab(ctk.CTkFrame):
         
         self._scanner = SecurityScanner()
         self._current_report: Optional[VulnerabilityReport] = None
+        self._batch_reports: List[VulnerabilityReport] = []
+        
+        # Batch results are handed to the UI thread through this queue; the
+        # generation id lets a newer audit discard results from older batches
+        self._batch_queue: queue.Queue = queue.Queue()
+        self._batch_generation = 0
+        self._batch_pending = 0
+        self._batch_poll_id = None
         
         self._create_ui()
     
@@ -183,6 +194,16 @@ class AuditorTab(ctk.CTkFrame):
             command=self._start_audit
         )
         self._audit_button.pack(side="left", padx=5)
+        
+        # Audit every scanned network at once
+        self._audit_all_button = create_button(
+            controls,
+            text="Audit All",
+            style="secondary",
+            width=100,
+            command=self._start_audit_all
+        )
+        self._audit_all_button.pack(side="left", padx=5)
     
     def _create_content(self):
         """Create main content area"""
@@ -223,14 +244,63 @@ class AuditorTab(ctk.CTkFrame):
         )
         self._vuln_scroll.grid(row=1, column=0, sticky="nsew", padx=10, pady=(0, 10))
         
-        # Placeholder
+        # Persistent list states, swapped in and out by _show_state()
         self._vuln_placeholder = ctk.CTkLabel(
             self._vuln_scroll,
             text="Select a network and click 'Start Audit'\nto analyze for vulnerabilities",
             font=(Fonts.FAMILY, Fonts.SIZE_MD),
             text_color=Colors.TEXT_MUTED
         )
-        self._vuln_placeholder.pack(pady=100)
+        
+        self._loading_label = ctk.CTkLabel(
+            self._vuln_scroll,
+            text="Analyzing...",
+            font=(Fonts.FAMILY, Fonts.SIZE_MD),
+            text_color=Colors.TEXT_MUTED
+        )
+        
+        self._list_container = ctk.CTkFrame(self._vuln_scroll, fg_color="transparent")
+        
+        self._empty_label = ctk.CTkLabel(
+            self._list_container,
+            text="No vulnerabilities found",
+            font=(Fonts.FAMILY, Fonts.SIZE_MD),
+            text_color=Colors.SUCCESS
+        )
+        
+        self._vuln_rows = []
+        self._state_widgets = {
+            "placeholder": (self._vuln_placeholder, {"pady": 100}),
+            "loading": (self._loading_label, {"pady": 50}),
+            "results": (self._list_container, {"fill": "x"}),
+        }
+        self._current_state: Optional[str] = None
+        self._show_state("placeholder")
+    
+    def _show_state(self, state: str, text: Optional[str] = None, text_color: Optional[str] = None):
+        """
+        Show exactly one of the list states.
+        
+        Args:
+            state: "placeholder", "loading" or "results"
+            text: Optional replacement text for the loading label
+            text_color: Optional text color for the loading label
+        """
+        if state == "loading":
+            self._loading_label.configure(
+                text=text or "Analyzing...",
+                text_color=text_color or Colors.TEXT_MUTED
+            )
+        
+        if state == self._current_state:
+            return
+        
+        if self._current_state is not None:
+            self._state_widgets[self._current_state][0].pack_forget()
+        
+        widget, pack_kwargs = self._state_widgets[state]
+        widget.pack(**pack_kwargs)
+        self._current_state = state
     
     def _create_summary_panel(self, parent):
         """Create audit summary panel"""
@@ -322,7 +392,6 @@ class AuditorTab(ctk.CTkFrame):
         target = self._target_var.get()
         
         if "Select" in target or "Scan" in target:
-            from ..utils import show_message
             show_message("Audit", "Please select a network to audit", "warning")
             return
         
@@ -337,7 +406,6 @@ class AuditorTab(ctk.CTkFrame):
         network_data = self._session.get_network(bssid) if self._session else None
         
         if not network_data:
-            from ..utils import show_message
             show_message("Audit", "Network not found. Try scanning again.", "error")
             return
         
@@ -346,17 +414,11 @@ class AuditorTab(ctk.CTkFrame):
         
         self._logger.info(f"Starting audit: {network.ssid}", "Auditor")
         
-        # Clear previous results
-        for widget in self._vuln_scroll.winfo_children():
-            widget.destroy()
+        # A single audit supersedes any batch still running
+        self._cancel_batch()
         
         # Show scanning status
-        ctk.CTkLabel(
-            self._vuln_scroll,
-            text="Analyzing...",
-            font=(Fonts.FAMILY, Fonts.SIZE_MD),
-            text_color=Colors.TEXT_MUTED
-        ).pack(pady=50)
+        self._show_state("loading")
         
         # Perform audit
         self.after(100, lambda: self._perform_audit(network))
@@ -375,36 +437,44 @@ class AuditorTab(ctk.CTkFrame):
             )
         except Exception as e:
             self._logger.error(f"Audit error: {e}", "Auditor")
-            for widget in self._vuln_scroll.winfo_children():
-                widget.destroy()
-            
-            ctk.CTkLabel(
-                self._vuln_scroll,
-                text=f"Audit failed: {e}",
-                font=(Fonts.FAMILY, Fonts.SIZE_MD),
-                text_color=Colors.ERROR
-            ).pack(pady=50)
+            self._show_state("loading", text=f"Audit failed: {e}", text_color=Colors.ERROR)
     
     def _display_results(self, report: VulnerabilityReport):
         """Display audit results"""
-        # Clear placeholder
-        for widget in self._vuln_scroll.winfo_children():
-            widget.destroy()
+        self._clear_rows()
         
         # Display vulnerabilities
         if report.vulnerabilities:
-            for vuln in report.vulnerabilities:
-                VulnerabilityRow(self._vuln_scroll, vuln).pack(fill="x", pady=3)
+            self._empty_label.pack_forget()
+            self._add_rows(report)
         else:
-            ctk.CTkLabel(
-                self._vuln_scroll,
-                text="No vulnerabilities found",
-                font=(Fonts.FAMILY, Fonts.SIZE_MD),
-                text_color=Colors.SUCCESS
-            ).pack(pady=50)
-        
-        # Update summary
-        score = report.security_score
+            self._empty_label.pack(pady=50)
+        
+        self._show_state("results")
+        
+        self._update_summary(
+            report.security_score,
+            report.critical_count,
+            report.high_count,
+            report.medium_count,
+            report.low_count,
+        )
+    
+    def _clear_rows(self):
+        """Remove all vulnerability rows from the results container"""
+        for row in self._vuln_rows:
+            row.destroy()
+        self._vuln_rows.clear()
+    
+    def _add_rows(self, report: VulnerabilityReport):
+        """Append a row for each vulnerability in the report"""
+        for vuln in report.vulnerabilities:
+            row = VulnerabilityRow(self._list_container, vuln)
+            row.pack(fill="x", pady=3)
+            self._vuln_rows.append(row)
+    
+    def _update_summary(self, score: int, critical: int, high: int, medium: int, low: int):
+        """Update the score display and severity counters"""
         if score >= 80:
             score_color = Colors.SUCCESS
         elif score >= 50:
@@ -415,10 +485,149 @@ class AuditorTab(ctk.CTkFrame):
         self._score_label.configure(text=str(score), text_color=score_color)
         
         # Update stats
-        self._stat_critical.configure(text=str(report.critical_count))
-        self._stat_high.configure(text=str(report.high_count))
-        self._stat_medium.configure(text=str(report.medium_count))
-        self._stat_low.configure(text=str(report.low_count))
+        self._stat_critical.configure(text=str(critical))
+        self._stat_high.configure(text=str(high))
+        self._stat_medium.configure(text=str(medium))
+        self._stat_low.configure(text=str(low))
+    
+    # ==========================================================================
+    # Batch auditing
+    # ==========================================================================
+    
+    def _start_audit_all(self):
+        """Audit every network from the last scan"""
+        networks = self._session.get_networks_list() if self._session else []
+        
+        if not networks:
+            show_message("Audit", "No networks to audit. Run a scan first.", "warning")
+            return
+        
+        self.audit_all([NetworkInfo(**n) for n in networks])
+    
+    def audit_all(self, networks: List[NetworkInfo]):
+        """
+        Audit several networks concurrently.
+        Reports are appended to the list as each audit finishes.
+        
+        Args:
+            networks: Networks to analyze
+        """
+        if not networks:
+            return
+        
+        self._cancel_batch()
+        self._batch_generation += 1
+        self._batch_pending = len(networks)
+        self._batch_reports = []
+        
+        self._clear_rows()
+        self._empty_label.pack_forget()
+        self._show_state("loading", text=f"Analyzing {len(networks)} networks...")
+        
+        if self._logger:
+            self._logger.info(f"Starting batch audit: {len(networks)} networks", "Auditor")
+        
+        threading.Thread(
+            target=self._run_batch,
+            args=(list(networks), self._batch_generation),
+            name="audit_batch",
+            daemon=True
+        ).start()
+        
+        self._batch_poll_id = self.after(100, self._poll_batch)
+    
+    def _cancel_batch(self):
+        """Stop tracking the running batch; its late results are discarded"""
+        self._batch_generation += 1
+        self._batch_pending = 0
+        
+        if self._batch_poll_id is not None:
+            self.after_cancel(self._batch_poll_id)
+            self._batch_poll_id = None
+    
+    def _run_batch(self, networks: List[NetworkInfo], generation: int):
+        """Fan audits out to a bounded pool (runs in background thread)"""
+        max_workers = min(len(networks), os.cpu_count() or 1)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self._audit_one, n): n for n in networks}
+            
+            for future in as_completed(futures):
+                try:
+                    report = future.result()
+                except Exception as e:
+                    network = futures[future]
+                    if self._logger:
+                        self._logger.error(f"Audit error ({network.bssid}): {e}", "Auditor")
+                    report = None
+                
+                # None marks a failed audit so the batch still completes
+                self._batch_queue.put((generation, report))
+    
+    @staticmethod
+    def _audit_one(network: NetworkInfo) -> VulnerabilityReport:
+        """Audit a single network in a worker thread"""
+        # SecurityScanner keeps per-scan state, so it is not shared across threads
+        return SecurityScanner().analyze_network(network)
+    
+    def _poll_batch(self):
+        """Apply finished batch audits from the queue (UI thread)"""
+        self._batch_poll_id = None
+        
+        while self._batch_pending:
+            try:
+                generation, report = self._batch_queue.get_nowait()
+            except queue.Empty:
+                break
+            
+            if generation != self._batch_generation:
+                continue  # Left over from a superseded batch
+            
+            self._batch_pending -= 1
+            if report is not None:
+                self._append_report(report)
+        
+        if self._batch_pending:
+            self._batch_poll_id = self.after(100, self._poll_batch)
+        else:
+            self._finish_batch()
+    
+    def _finish_batch(self):
+        """Settle the list state once every audit in the batch has reported"""
+        if not self._batch_reports:
+            self._show_state("loading", text="Audit failed for all networks", text_color=Colors.ERROR)
+            return
+        
+        if not self._vuln_rows:
+            self._empty_label.pack(pady=50)
+        
+        if self._logger:
+            self._logger.info(f"Batch audit complete: {len(self._batch_reports)} networks", "Auditor")
+    
+    def _append_report(self, report: VulnerabilityReport):
+        """Add a finished batch report to the display (UI thread)"""
+        self._batch_reports.append(report)
+        self._current_report = report
+        
+        self._add_rows(report)
+        self._show_state("results")
+        
+        # Summary shows the weakest network and totals across the batch
+        reports = self._batch_reports
+        self._update_summary(
+            min(r.security_score for r in reports),
+            sum(r.critical_count for r in reports),
+            sum(r.high_count for r in reports),
+            sum(r.medium_count for r in reports),
+            sum(r.low_count for r in reports),
+        )
+        
+        if self._logger:
+            self._logger.info(
+                f"Audit complete: {report.target_ssid} - Score {report.security_score}, "
+                f"{len(report.vulnerabilities)} issues found",
+                "Auditor"
+            )
     
     def on_show(self):
         """Called when page is shown"""
@@ -432,6 +641,11 @@ class AuditorTab(ctk.CTkFrame):
             else:
                 self._target_menu.configure(values=["Scan networks first"])
                 self._target_var.set("Scan networks first")
+    
+    def destroy(self):
+        """Stop polling batch results before the tab goes away"""
+        self._cancel_batch()
+        super().destroy()
 
 
 __all__ = ['AuditorTab']
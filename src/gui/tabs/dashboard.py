@@ -4,14 +4,31 @@ Main overview page with system status and quick actions
 """
 
 import customtkinter as ctk
-from typing import Optional
-import time
 
-from ...settings import Colors, Fonts, Layout, IS_WINDOWS, IS_KALI, RUNNING_AS_ADMIN
-from ..utils import create_button, create_label, create_card
+from ...settings import Colors, Fonts, IS_WINDOWS, IS_KALI, RUNNING_AS_ADMIN
+from ..utils import create_button, create_label, create_card, show_message
 from ..passwords_dialog import SavedPasswordsDialog
 
 
+# System info rows depend only on import-time platform flags
+_INFO_ITEMS = (
+    ("Platform", "Windows" if IS_WINDOWS else ("Kali Linux" if IS_KALI else "Linux")),
+    ("Privileges", "Administrator" if RUNNING_AS_ADMIN else "Standard User"),
+    ("Driver", "Windows WiFi" if IS_WINDOWS else "Linux WiFi"),
+    ("Monitor Mode", "Not Available" if IS_WINDOWS else ("Available" if IS_KALI else "Limited")),
+    ("Security Features", "Basic" if IS_WINDOWS else ("Full" if IS_KALI else "Basic")),
+)
+
+# Quick actions: (text, icon, hover color, handler method name)
+_QUICK_ACTIONS = (
+    ("Start Scan", "📡", Colors.PRIMARY, "_start_scan"),
+    ("Current Network", "🌐", Colors.SUCCESS, "_show_current"),
+    ("Security Audit", "🔒", Colors.WARNING, "_start_audit"),
+    ("View Passwords", "🔑", Colors.ACCENT, "_view_passwords"),
+    ("Refresh All", "🔄", Colors.INFO, "_refresh"),
+)
+
+
 class StatCard(ctk.CTkFrame):
     """Card displaying a single statistic"""
     
@@ -190,15 +207,8 @@ class DashboardTab(ctk.CTkFrame):
         actions_grid = ctk.CTkFrame(content, fg_color="transparent")
         actions_grid.pack(fill="both", expand=True)
         
-        actions = [
-            ("Start Scan", "📡", Colors.PRIMARY, self._start_scan),
-            ("Current Network", "🌐", Colors.SUCCESS, self._show_current),
-            ("Security Audit", "🔒", Colors.WARNING, self._start_audit),
-            ("View Passwords", "🔑", Colors.ACCENT, self._view_passwords),
-            ("Refresh All", "🔄", Colors.INFO, self._refresh),
-        ]
-        
-        for i, (text, icon, color, cmd) in enumerate(actions):
+        for i, (text, icon, color, attr_name) in enumerate(_QUICK_ACTIONS):
+            cmd = getattr(self, attr_name)
             row = i // 3
             col = i % 3
             
@@ -226,16 +236,7 @@ class DashboardTab(ctk.CTkFrame):
         card, content = create_card(parent, title="System Information")
         card.grid(row=0, column=1, sticky="nsew")
         
-        # Info items
-        info_items = [
-            ("Platform", "Windows" if IS_WINDOWS else ("Kali Linux" if IS_KALI else "Linux")),
-            ("Privileges", "Administrator" if RUNNING_AS_ADMIN else "Standard User"),
-            ("Driver", "Windows WiFi" if IS_WINDOWS else "Linux WiFi"),
-            ("Monitor Mode", "Not Available" if IS_WINDOWS else ("Available" if IS_KALI else "Limited")),
-            ("Security Features", "Basic" if IS_WINDOWS else ("Full" if IS_KALI else "Basic")),
-        ]
-        
-        for label, value in info_items:
+        for label, value in _INFO_ITEMS:
             row = ctk.CTkFrame(content, fg_color="transparent")
             row.pack(fill="x", pady=5)
             
@@ -269,8 +270,6 @@ class DashboardTab(ctk.CTkFrame):
     
     def _show_current(self):
         """Show current network info"""
-        from ..utils import show_message
-        
         if not self._driver:
             show_message("Current Network", "Driver not initialized", "warning")
             return
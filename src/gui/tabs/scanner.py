@@ -3,123 +3,221 @@ WiFi Tester Pro v6.0 - Scanner Tab
 Network scanning and discovery page
 """
 
+import math
+import queue
+from operator import attrgetter
 import customtkinter as ctk
-from typing import Optional, List, Dict
-import time
+from typing import Optional, List, Dict, Tuple
 
-from ...settings import Colors, Fonts, Layout, NetworkInfo, EventType
+from ...settings import Colors, Fonts, NetworkInfo, EventType
 from ..utils import (
-    create_button, create_label, format_signal,
-    get_signal_color, get_security_color
+    create_button, create_label, annotate_networks
 )
 
 
-class NetworkRow(ctk.CTkFrame):
-    """Single row displaying network information"""
+# Static fonts and list header layout, built once at import
+_FONT_SM = (Fonts.FAMILY, Fonts.SIZE_SM)
+_FONT_MD = (Fonts.FAMILY, Fonts.SIZE_MD)
+_FONT_HEADER = (Fonts.FAMILY, Fonts.SIZE_SM, "bold")
+
+_HEADER_COLUMNS = (
+    ("", 18),
+    ("SSID", 200),
+    ("BSSID", 150),
+    ("Channel", 60),
+    ("Signal", 80),
+    ("Security", 80),
+)
+
+_SIGNAL_KEY = attrgetter("signal")
+
+_DETAIL_FIELDS = ("SSID", "BSSID", "Signal", "Channel", "Frequency", "Security", "WPS")
+
+
+class NetworkListCanvas(ctk.CTkCanvas):
+    """
+    Virtualized network list drawn on a single canvas.
+    Only enough row slots to cover the viewport are created; scrolling
+    moves and re-labels those slots instead of creating new items.
+    """
     
-    def __init__(
-        self,
-        parent,
-        network: NetworkInfo,
-        on_select=None,
-        **kwargs
-    ):
+    ROW_HEIGHT = 50
+    ROW_GAP = 4
+    OVERSCAN = 2
+    
+    # (item key, x offset, anchor) - aligned with the list header columns
+    _TEXT_COLUMNS = (
+        ("ssid", 28, "w"),
+        ("bssid", 248, "w"),
+        ("channel", 448, "center"),
+        ("signal", 538, "center"),
+        ("security", 638, "center"),
+    )
+    
+    _FONT_SSID = _FONT_MD
+    _FONT_BSSID = (Fonts.MONO, Fonts.SIZE_SM)
+    _COLUMN_FONTS = {"ssid": _FONT_SSID, "bssid": _FONT_BSSID}
+    
+    def __init__(self, parent, on_select=None, **kwargs):
         super().__init__(
             parent,
-            fg_color=Colors.SURFACE_DARK,
-            corner_radius=8,
-            height=50,
+            bg=Colors.SURFACE_MEDIUM,
+            highlightthickness=0,
+            yscrollincrement=self.ROW_HEIGHT + self.ROW_GAP,
             **kwargs
         )
         
-        self._network = network
         self._on_select = on_select
-        self._selected = False
-        
-        self.pack_propagate(False)
-        self._create_ui()
-        
-        # Bind click
+        self._networks: List[NetworkInfo] = []
+        self._styles: List[Tuple[str, str, str]] = []
+        self._slots: List[Dict[str, int]] = []
+        self._slot_tags: List[str] = []
+        self._selected_bssid: Optional[str] = None
+        self._width = 1
+        self._height = 1
+        
+        self.bind("<Configure>", self._on_configure)
         self.bind("<Button-1>", self._on_click)
-        for child in self.winfo_children():
-            child.bind("<Button-1>", self._on_click)
+        self.bind("<MouseWheel>", self._on_mousewheel)
+        self.bind("<Button-4>", self._on_mousewheel)
+        self.bind("<Button-5>", self._on_mousewheel)
     
-    def _create_ui(self):
-        """Create row UI"""
-        # Signal indicator
-        signal_color = get_signal_color(self._network.signal)
-        signal_frame = ctk.CTkFrame(
-            self,
-            width=8,
-            fg_color=signal_color,
-            corner_radius=4
-        )
-        signal_frame.pack(side="left", fill="y", padx=(0, 10))
-        
-        # SSID
-        ssid_text = self._network.ssid if self._network.ssid else "<Hidden>"
-        ctk.CTkLabel(
-            self,
-            text=ssid_text,
-            font=(Fonts.FAMILY, Fonts.SIZE_MD),
-            text_color=Colors.TEXT_PRIMARY,
-            width=200,
-            anchor="w"
-        ).pack(side="left", padx=10)
-        
-        # BSSID
-        ctk.CTkLabel(
-            self,
-            text=self._network.bssid,
-            font=(Fonts.MONO, Fonts.SIZE_SM),
-            text_color=Colors.TEXT_SECONDARY,
-            width=150,
-            anchor="w"
-        ).pack(side="left", padx=10)
-        
-        # Channel
-        ctk.CTkLabel(
-            self,
-            text=f"CH {self._network.channel}",
-            font=(Fonts.FAMILY, Fonts.SIZE_SM),
-            text_color=Colors.TEXT_SECONDARY,
-            width=60,
-            anchor="center"
-        ).pack(side="left", padx=5)
+    @property
+    def _pitch(self) -> int:
+        return self.ROW_HEIGHT + self.ROW_GAP
+    
+    def _create_slot(self, index: int) -> Dict[str, int]:
+        """Create the canvas items for one row slot (hidden until rendered)"""
+        tag = f"slot{index}"
+        slot = {
+            "bg": self.create_rectangle(
+                0, 0, 0, 0, fill=Colors.SURFACE_DARK, width=0, tags=(tag,)
+            ),
+            "bar": self.create_rectangle(
+                0, 0, 0, 0, fill=Colors.SURFACE_LIGHT, width=0, tags=(tag,)
+            ),
+        }
+        
+        for key, x, anchor in self._TEXT_COLUMNS:
+            slot[key] = self.create_text(
+                x, 0,
+                anchor=anchor,
+                font=self._COLUMN_FONTS.get(key, _FONT_SM),
+                fill=Colors.TEXT_PRIMARY if key == "ssid" else Colors.TEXT_SECONDARY,
+                tags=(tag,)
+            )
         
-        # Signal
-        ctk.CTkLabel(
-            self,
-            text=f"{self._network.signal} dBm",
-            font=(Fonts.FAMILY, Fonts.SIZE_SM),
-            text_color=signal_color,
-            width=80,
-            anchor="center"
-        ).pack(side="left", padx=5)
+        self.itemconfigure(tag, state="hidden")
+        return slot
+    
+    def _ensure_slots(self):
+        """Grow the slot pool to cover the current viewport"""
+        needed = math.ceil(self._height / self._pitch) + self.OVERSCAN
+        while len(self._slots) < needed:
+            index = len(self._slots)
+            self._slots.append(self._create_slot(index))
+            self._slot_tags.append(f"slot{index}")
+    
+    def _update_scrollregion(self):
+        height = len(self._networks) * self._pitch
+        self.configure(scrollregion=(0, 0, self._width, height))
+    
+    def set_networks(
+        self,
+        networks: List[NetworkInfo],
+        styles: Optional[List[Tuple[str, str, str]]] = None
+    ):
+        """
+        Replace the displayed networks (already in display order).
+        styles holds annotate_networks() output aligned with networks.
+        """
+        self._networks = list(networks)
+        self._styles = styles if styles is not None else annotate_networks(self._networks)
+        self._update_scrollregion()
+        self.refresh()
+    
+    def set_selected(self, bssid: Optional[str]):
+        """Highlight the row for the given BSSID"""
+        self._selected_bssid = bssid
+        self.refresh()
+    
+    def clear(self):
+        """Remove all networks from the list"""
+        self._selected_bssid = None
+        self.set_networks([])
+        self.yview_moveto(0)
+    
+    def refresh(self):
+        """Render the visible slice of the list into the slot pool"""
+        pitch = self._pitch
+        first = max(0, int(self.canvasy(0) // pitch))
+        count = len(self._networks)
+        
+        for i, (slot, tag) in enumerate(zip(self._slots, self._slot_tags)):
+            index = first + i
+            if index >= count:
+                self.itemconfigure(tag, state="hidden")
+                continue
+            
+            network = self._networks[index]
+            y0 = index * pitch
+            y1 = y0 + self.ROW_HEIGHT
+            y_mid = (y0 + y1) / 2
+            
+            self.coords(slot["bg"], 0, y0, self._width, y1)
+            self.coords(slot["bar"], 0, y0, 8, y1)
+            for key, x, _ in self._TEXT_COLUMNS:
+                self.coords(slot[key], x, y_mid)
+            
+            selected = network.bssid == self._selected_bssid
+            signal_color, _, security_color = self._styles[index]
+            
+            self.itemconfigure(
+                slot["bg"],
+                fill=Colors.PRIMARY if selected else Colors.SURFACE_DARK
+            )
+            self.itemconfigure(slot["bar"], fill=signal_color)
+            self.itemconfigure(slot["ssid"], text=network.ssid if network.ssid else "<Hidden>")
+            self.itemconfigure(slot["bssid"], text=network.bssid)
+            self.itemconfigure(slot["channel"], text=f"CH {network.channel}")
+            self.itemconfigure(slot["signal"], text=f"{network.signal} dBm", fill=signal_color)
+            self.itemconfigure(
+                slot["security"],
+                text=network.security[:10],
+                fill=security_color
+            )
+            self.itemconfigure(tag, state="normal")
+    
+    def on_scroll(self, *args):
+        """Scrollbar command: move the view and re-render the slots"""
+        self.yview(*args)
+        self.refresh()
+    
+    def _on_configure(self, event):
+        """Track viewport size and grow the slot pool if needed"""
+        self._width = event.width
+        self._height = event.height
+        self._ensure_slots()
+        self._update_scrollregion()
+        self.refresh()
+    
+    def _on_mousewheel(self, event):
+        """Scroll one row per wheel notch"""
+        if event.num == 4:
+            delta = -1
+        elif event.num == 5:
+            delta = 1
+        else:
+            delta = -1 if event.delta > 0 else 1
         
-        # Security
-        security_color = get_security_color(self._network.security)
-        ctk.CTkLabel(
-            self,
-            text=self._network.security[:10],
-            font=(Fonts.FAMILY, Fonts.SIZE_SM),
-            text_color=security_color,
-            width=80,
-            anchor="center"
-        ).pack(side="left", padx=5)
+        self.yview_scroll(delta, "units")
+        self.refresh()
     
     def _on_click(self, event):
-        """Handle row click"""
-        if self._on_select:
-            self._on_select(self._network)
-    
-    def set_selected(self, selected: bool):
-        """Set selection state"""
-        self._selected = selected
-        if selected:
-            self.configure(fg_color=Colors.PRIMARY)
-        else:
-            self.configure(fg_color=Colors.SURFACE_DARK)
+        """Map the click position to a network and notify the listener"""
+        index = int(self.canvasy(event.y) // self._pitch)
+        if 0 <= index < len(self._networks) and self._on_select:
+            self._on_select(self._networks[index])
 
 
 class ScannerTab(ctk.CTkFrame):
@@ -127,6 +225,8 @@ class ScannerTab(ctk.CTkFrame):
     Scanner page for network discovery.
     """
     
+    FLUSH_INTERVAL = 100  # ms between merges of found networks
+    
     def __init__(
         self,
         parent,
@@ -143,12 +243,18 @@ class ScannerTab(ctk.CTkFrame):
         self._engine = engine
         self._logger = logger
         
-        self._network_rows: Dict[str, NetworkRow] = {}
         self._selected_network: Optional[NetworkInfo] = None
         self._is_scanning = False
         
+        # Networks currently listed, and found events waiting to be merged
+        self._networks: Dict[str, NetworkInfo] = {}
+        self._pending_networks: queue.Queue = queue.Queue()
+        
         self._create_ui()
         self._bind_events()
+        
+        # Found events are merged by a poll that only ever runs on the Tk thread
+        self._flush_id = self.after(self.FLUSH_INTERVAL, self._flush_pending)
     
     def _create_ui(self):
         """Create scanner UI"""
@@ -180,7 +286,7 @@ class ScannerTab(ctk.CTkFrame):
         ctk.CTkLabel(
             controls,
             text="Interface:",
-            font=(Fonts.FAMILY, Fonts.SIZE_SM),
+            font=_FONT_SM,
             text_color=Colors.TEXT_SECONDARY
         ).pack(side="left", padx=(0, 5))
         
@@ -236,20 +342,11 @@ class ScannerTab(ctk.CTkFrame):
         header_row.grid(row=0, column=0, sticky="ew", padx=10, pady=(10, 5))
         header_row.pack_propagate(False)
         
-        columns = [
-            ("", 18),
-            ("SSID", 200),
-            ("BSSID", 150),
-            ("Channel", 60),
-            ("Signal", 80),
-            ("Security", 80),
-        ]
-        
-        for text, width in columns:
+        for text, width in _HEADER_COLUMNS:
             ctk.CTkLabel(
                 header_row,
                 text=text,
-                font=(Fonts.FAMILY, Fonts.SIZE_SM, "bold"),
+                font=_FONT_HEADER,
                 text_color=Colors.TEXT_MUTED,
                 width=width,
                 anchor="w" if text else "center"
@@ -262,24 +359,38 @@ class ScannerTab(ctk.CTkFrame):
             fg_color=Colors.BORDER
         ).grid(row=0, column=0, sticky="ew", padx=10, pady=(45, 0))
         
-        # Scrollable list
-        self._network_scroll = ctk.CTkScrollableFrame(
+        # Virtualized list
+        self._network_list = NetworkListCanvas(
             list_container,
-            fg_color="transparent"
+            on_select=self._on_network_select
         )
-        self._network_scroll.grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
+        self._network_list.grid(row=1, column=0, sticky="nsew", padx=(10, 0), pady=5)
         
-        # Status label (placed in scroll frame initially, will be managed separately)
-        self._status_frame = ctk.CTkFrame(self._network_scroll, fg_color="transparent")
-        self._status_frame.pack(fill="x", pady=50)
+        scrollbar = ctk.CTkScrollbar(list_container, command=self._network_list.on_scroll)
+        scrollbar.grid(row=1, column=1, sticky="ns", padx=(0, 5), pady=5)
+        self._network_list.configure(yscrollcommand=scrollbar.set)
         
+        # Status label, overlaid on the list while there is nothing to show
+        self._status_var = ctk.StringVar(value="Click 'Start Scan' to discover networks")
         self._status_label = ctk.CTkLabel(
-            self._status_frame,
-            text="Click 'Start Scan' to discover networks",
-            font=(Fonts.FAMILY, Fonts.SIZE_MD),
+            list_container,
+            textvariable=self._status_var,
+            font=_FONT_MD,
             text_color=Colors.TEXT_MUTED
         )
-        self._status_label.pack()
+        self._status_visible = False
+        self._set_status_visible(True)
+    
+    def _set_status_visible(self, visible: bool):
+        """Show or hide the status overlay, touching geometry only on change"""
+        if visible == self._status_visible:
+            return
+        
+        self._status_visible = visible
+        if visible:
+            self._status_label.place(in_=self._network_list, relx=0.5, y=50, anchor="n")
+        else:
+            self._status_label.place_forget()
     
     def _create_details_panel(self):
         """Create selected network details panel"""
@@ -296,12 +407,44 @@ class ScannerTab(ctk.CTkFrame):
         self._details_content = ctk.CTkFrame(self._details_frame, fg_color="transparent")
         self._details_content.pack(fill="both", expand=True, padx=20, pady=15)
         
-        ctk.CTkLabel(
+        self._details_placeholder = ctk.CTkLabel(
             self._details_content,
             text="Select a network to view details",
-            font=(Fonts.FAMILY, Fonts.SIZE_MD),
+            font=_FONT_MD,
             text_color=Colors.TEXT_MUTED
-        ).pack(pady=30)
+        )
+        self._details_placeholder.pack(pady=30)
+        
+        # Details grid is built on first selection
+        self._details_grid: Optional[ctk.CTkFrame] = None
+        self._detail_vars: Dict[str, ctk.StringVar] = {}
+        self._details_built = False
+    
+    def _build_details_grid(self):
+        """Create the persistent label/value grid for network details"""
+        self._details_grid = ctk.CTkFrame(self._details_content, fg_color="transparent")
+        
+        for field in _DETAIL_FIELDS:
+            item = ctk.CTkFrame(self._details_grid, fg_color="transparent")
+            item.pack(side="left", padx=15)
+            
+            ctk.CTkLabel(
+                item,
+                text=field,
+                font=_FONT_SM,
+                text_color=Colors.TEXT_MUTED
+            ).pack(anchor="w")
+            
+            var = ctk.StringVar()
+            ctk.CTkLabel(
+                item,
+                textvariable=var,
+                font=_FONT_MD,
+                text_color=Colors.TEXT_PRIMARY
+            ).pack(anchor="w")
+            self._detail_vars[field] = var
+        
+        self._details_built = True
     
     def _bind_events(self):
         """Bind session events"""
@@ -320,6 +463,22 @@ class ScannerTab(ctk.CTkFrame):
         else:
             self._start_scan()
     
+    def _set_scan_button_state(self, scanning: bool):
+        """Update scanning flag and scan button in a single configure"""
+        self._is_scanning = scanning
+        if scanning:
+            self._scan_button.configure(
+                text="⏹ Stop",
+                fg_color=Colors.ERROR,
+                hover_color=Colors.ERROR
+            )
+        else:
+            self._scan_button.configure(
+                text="📡 Start Scan",
+                fg_color=Colors.PRIMARY,
+                hover_color=Colors.PRIMARY_HOVER
+            )
+    
     def _start_scan(self):
         """Start network scan"""
         if not self._driver:
@@ -327,8 +486,7 @@ class ScannerTab(ctk.CTkFrame):
                 self._logger.error("No driver available", "Scanner")
             return
         
-        self._is_scanning = True
-        self._scan_button.configure(text="⏹ Stop")
+        self._set_scan_button_state(True)
         
         # Show scanning status
         self._show_status("Scanning...")
@@ -357,8 +515,7 @@ class ScannerTab(ctk.CTkFrame):
     
     def _on_scan_done(self, networks: List[NetworkInfo]):
         """Handle scan completion"""
-        self._is_scanning = False
-        self._scan_button.configure(text="📡 Start Scan")
+        self._set_scan_button_state(False)
         
         if self._session:
             self._session.is_scanning = False
@@ -373,8 +530,7 @@ class ScannerTab(ctk.CTkFrame):
     
     def _on_scan_error(self, error: Exception):
         """Handle scan error"""
-        self._is_scanning = False
-        self._scan_button.configure(text="📡 Start Scan")
+        self._set_scan_button_state(False)
         
         if self._session:
             self._session.is_scanning = False
@@ -387,67 +543,40 @@ class ScannerTab(ctk.CTkFrame):
     
     def _stop_scan(self):
         """Stop scanning"""
-        self._is_scanning = False
-        self._scan_button.configure(text="📡 Start Scan")
+        self._set_scan_button_state(False)
         
         if self._session:
             self._session.is_scanning = False
     
     def _show_status(self, text: str):
         """Show status message in the network list area"""
-        # Clear existing content
-        for widget in self._network_scroll.winfo_children():
-            widget.destroy()
-        self._network_rows.clear()
-        
-        # Create new status frame and label
-        self._status_frame = ctk.CTkFrame(self._network_scroll, fg_color="transparent")
-        self._status_frame.pack(fill="x", pady=50)
+        self._networks = {}
+        self._network_list.clear()
         
-        self._status_label = ctk.CTkLabel(
-            self._status_frame,
-            text=text,
-            font=(Fonts.FAMILY, Fonts.SIZE_MD),
-            text_color=Colors.TEXT_MUTED
-        )
-        self._status_label.pack()
+        self._status_var.set(text)
+        self._set_status_visible(True)
     
     def _update_network_list(self, networks: List[NetworkInfo]):
         """Update the network list display"""
-        # Clear existing rows
-        for widget in self._network_scroll.winfo_children():
-            widget.destroy()
-        self._network_rows.clear()
+        self._networks = {network.bssid: network for network in networks}
         
         if not networks:
             self._show_status("No networks found")
             return
         
+        self._set_status_visible(False)
+        
         # Sort by signal strength
-        networks = sorted(networks, key=lambda n: n.signal, reverse=True)
-        
-        # Add rows
-        for network in networks:
-            row = NetworkRow(
-                self._network_scroll,
-                network,
-                on_select=self._on_network_select
-            )
-            row.pack(fill="x", pady=2)
-            self._network_rows[network.bssid] = row
+        networks = sorted(networks, key=_SIGNAL_KEY, reverse=True)
+        
+        # Derive display colors once per scan rather than on every render
+        self._network_list.set_networks(networks, annotate_networks(networks))
     
     def _on_network_select(self, network: NetworkInfo):
         """Handle network selection"""
         # Update selection
-        if self._selected_network:
-            old_bssid = self._selected_network.bssid
-            if old_bssid in self._network_rows:
-                self._network_rows[old_bssid].set_selected(False)
-        
         self._selected_network = network
-        
-        if network.bssid in self._network_rows:
-            self._network_rows[network.bssid].set_selected(True)
+        self._network_list.set_selected(network.bssid)
         
         if self._session:
             self._session.selected_network = network.bssid
@@ -457,69 +586,30 @@ class ScannerTab(ctk.CTkFrame):
     
     def _show_network_details(self, network: NetworkInfo):
         """Show selected network details"""
-        # Clear details
-        for widget in self._details_content.winfo_children():
-            widget.destroy()
-        
-        # Create details grid
-        details = [
-            ("SSID", network.ssid or "<Hidden>"),
-            ("BSSID", network.bssid),
-            ("Signal", f"{network.signal} dBm ({network.signal_quality})"),
-            ("Channel", str(network.channel)),
-            ("Frequency", f"{network.frequency} MHz"),
-            ("Security", network.security),
-            ("WPS", "Yes" if network.wps else "No"),
-        ]
-        
-        row_frame = ctk.CTkFrame(self._details_content, fg_color="transparent")
-        row_frame.pack(fill="x")
-        
-        for i, (label, value) in enumerate(details):
-            col = i % 4
-            
-            item = ctk.CTkFrame(row_frame, fg_color="transparent")
-            item.pack(side="left", padx=15)
-            
-            ctk.CTkLabel(
-                item,
-                text=label,
-                font=(Fonts.FAMILY, Fonts.SIZE_SM),
-                text_color=Colors.TEXT_MUTED
-            ).pack(anchor="w")
-            
-            ctk.CTkLabel(
-                item,
-                text=value,
-                font=(Fonts.FAMILY, Fonts.SIZE_MD),
-                text_color=Colors.TEXT_PRIMARY
-            ).pack(anchor="w")
+        if not self._details_built:
+            self._build_details_grid()
+        
+        self._details_placeholder.pack_forget()
+        self._details_grid.pack(fill="x")
+        
+        values = self._detail_vars
+        values["SSID"].set(network.ssid or "<Hidden>")
+        values["BSSID"].set(network.bssid)
+        values["Signal"].set(f"{network.signal} dBm ({network.signal_quality})")
+        values["Channel"].set(str(network.channel))
+        values["Frequency"].set(f"{network.frequency} MHz")
+        values["Security"].set(network.security)
+        values["WPS"].set("Yes" if network.wps else "No")
     
     def _clear_results(self):
         """Clear scan results"""
-        for widget in self._network_scroll.winfo_children():
-            widget.destroy()
-        self._network_rows.clear()
         self._selected_network = None
-        
-        self._status_label = ctk.CTkLabel(
-            self._network_scroll,
-            text="Click 'Start Scan' to discover networks",
-            font=(Fonts.FAMILY, Fonts.SIZE_MD),
-            text_color=Colors.TEXT_MUTED
-        )
-        self._status_label.pack(pady=50)
+        self._show_status("Click 'Start Scan' to discover networks")
         
         # Clear details
-        for widget in self._details_content.winfo_children():
-            widget.destroy()
-        
-        ctk.CTkLabel(
-            self._details_content,
-            text="Select a network to view details",
-            font=(Fonts.FAMILY, Fonts.SIZE_MD),
-            text_color=Colors.TEXT_MUTED
-        ).pack(pady=30)
+        if self._details_built:
+            self._details_grid.pack_forget()
+            self._details_placeholder.pack(pady=30)
         
         if self._session:
             self._session.clear_networks()
@@ -537,8 +627,36 @@ class ScannerTab(ctk.CTkFrame):
         pass  # Already handled by callback
     
     def _on_network_found(self, event_type, data):
-        """Handle network found event"""
-        pass  # Will refresh on next scan
+        """Queue a found network; may be called from a worker thread"""
+        network = data.get("network")
+        if network is None:
+            return
+        
+        self._pending_networks.put(network)
+    
+    def _flush_pending(self):
+        """Merge queued found networks into the list in one refresh"""
+        changed = False
+        while True:
+            try:
+                network = self._pending_networks.get_nowait()
+            except queue.Empty:
+                break
+            if self._networks.get(network.bssid) is not network:
+                self._networks[network.bssid] = network
+                changed = True
+        
+        if changed:
+            self._update_network_list(list(self._networks.values()))
+        
+        self._flush_id = self.after(self.FLUSH_INTERVAL, self._flush_pending)
+    
+    def destroy(self):
+        """Stop the found-network poll before the tab goes away"""
+        if self._flush_id is not None:
+            self.after_cancel(self._flush_id)
+            self._flush_id = None
+        super().destroy()
     
     def on_show(self):
         """Called when page is shown"""
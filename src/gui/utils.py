@@ -3,11 +3,111 @@ WiFi Tester Pro v6.0 - GUI Utilities
 Helper functions for creating consistent UI elements
 """
 
+import re
 import customtkinter as ctk
-from typing import Optional, Callable, Tuple
-from tkinter import messagebox
+from functools import lru_cache
+from typing import Optional, Callable, Tuple, List
 
-from ..settings import Colors, Fonts
+from ..settings import Colors, Fonts, NetworkInfo
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+# Theme colors read on every entry/card/separator build
+_C_BORDER = Colors.BORDER
+_C_SURFACE_DARK = Colors.SURFACE_DARK
+_C_SURFACE_MEDIUM = Colors.SURFACE_MEDIUM
+_C_TEXT_PRIMARY = Colors.TEXT_PRIMARY
+_C_TEXT_MUTED = Colors.TEXT_MUTED
+
+# Font tuples shared by the widget builders below
+_FONT_TITLE = (Fonts.FAMILY, Fonts.SIZE_TITLE, "bold")
+_FONT_HEADING = (Fonts.FAMILY, Fonts.SIZE_XL, "bold")
+_FONT_LG = (Fonts.FAMILY, Fonts.SIZE_LG)
+_FONT_LG_BOLD = (Fonts.FAMILY, Fonts.SIZE_LG, "bold")
+_FONT_MD = (Fonts.FAMILY, Fonts.SIZE_MD)
+_FONT_SM = (Fonts.FAMILY, Fonts.SIZE_SM)
+
+# Button style configurations
+_BUTTON_STYLES = {
+    "primary": {
+        "fg_color": Colors.PRIMARY,
+        "hover_color": Colors.PRIMARY_HOVER,
+        "text_color": Colors.TEXT_PRIMARY,
+    },
+    "secondary": {
+        "fg_color": Colors.SURFACE_LIGHT,
+        "hover_color": Colors.SURFACE_MEDIUM,
+        "text_color": Colors.TEXT_PRIMARY,
+    },
+    "danger": {
+        "fg_color": Colors.ERROR,
+        "hover_color": "#C0392B",
+        "text_color": Colors.TEXT_PRIMARY,
+    },
+    "success": {
+        "fg_color": Colors.SUCCESS,
+        "hover_color": "#27AE60",
+        "text_color": Colors.TEXT_PRIMARY,
+    },
+    "warning": {
+        "fg_color": Colors.WARNING,
+        "hover_color": "#E67E22",
+        "text_color": Colors.TEXT_PRIMARY,
+    },
+    "ghost": {
+        "fg_color": "transparent",
+        "hover_color": Colors.SURFACE_LIGHT,
+        "text_color": Colors.TEXT_SECONDARY,
+        "border_width": 1,
+        "border_color": Colors.BORDER,
+    },
+}
+
+# Label style configurations
+_LABEL_STYLES = {
+    "title": {
+        "font": _FONT_TITLE,
+        "text_color": Colors.TEXT_PRIMARY,
+    },
+    "heading": {
+        "font": _FONT_HEADING,
+        "text_color": Colors.TEXT_PRIMARY,
+    },
+    "subheading": {
+        "font": _FONT_LG,
+        "text_color": Colors.TEXT_PRIMARY,
+    },
+    "normal": {
+        "font": _FONT_MD,
+        "text_color": Colors.TEXT_PRIMARY,
+    },
+    "secondary": {
+        "font": _FONT_MD,
+        "text_color": Colors.TEXT_SECONDARY,
+    },
+    "muted": {
+        "font": _FONT_SM,
+        "text_color": Colors.TEXT_MUTED,
+    },
+    "caption": {
+        "font": _FONT_SM,
+        "text_color": Colors.TEXT_SECONDARY,
+    },
+}
+
+
+@lru_cache(maxsize=None)
+def get_font(size: int, weight: str = "normal", family: Optional[str] = None) -> ctk.CTkFont:
+    """
+    Get a shared CTkFont, created on first use (a Tk root must exist).
+    Widgets holding the same spec share one font object.
+    """
+    return ctk.CTkFont(family=family or Fonts.FAMILY, size=size, weight=weight)
 
 
 def center_window(window: ctk.CTk, width: int, height: int):
@@ -47,43 +147,7 @@ def create_button(
     Returns:
         Configured CTkButton
     """
-    # Style configurations
-    styles = {
-        "primary": {
-            "fg_color": Colors.PRIMARY,
-            "hover_color": Colors.PRIMARY_HOVER,
-            "text_color": Colors.TEXT_PRIMARY,
-        },
-        "secondary": {
-            "fg_color": Colors.SURFACE_LIGHT,
-            "hover_color": Colors.SURFACE_MEDIUM,
-            "text_color": Colors.TEXT_PRIMARY,
-        },
-        "danger": {
-            "fg_color": Colors.ERROR,
-            "hover_color": "#C0392B",
-            "text_color": Colors.TEXT_PRIMARY,
-        },
-        "success": {
-            "fg_color": Colors.SUCCESS,
-            "hover_color": "#27AE60",
-            "text_color": Colors.TEXT_PRIMARY,
-        },
-        "warning": {
-            "fg_color": Colors.WARNING,
-            "hover_color": "#E67E22",
-            "text_color": Colors.TEXT_PRIMARY,
-        },
-        "ghost": {
-            "fg_color": "transparent",
-            "hover_color": Colors.SURFACE_LIGHT,
-            "text_color": Colors.TEXT_SECONDARY,
-            "border_width": 1,
-            "border_color": Colors.BORDER,
-        },
-    }
-    
-    style_config = styles.get(style, styles["primary"])
+    style_config = _BUTTON_STYLES.get(style, _BUTTON_STYLES["primary"])
     
     display_text = f"{icon} {text}" if icon else text
     
@@ -94,7 +158,7 @@ def create_button(
         width=width,
         height=height,
         corner_radius=8,
-        font=(Fonts.FAMILY, Fonts.SIZE_MD),
+        font=_FONT_MD,
         **style_config,
         **kwargs
     )
@@ -118,38 +182,7 @@ def create_label(
     Returns:
         Configured CTkLabel
     """
-    styles = {
-        "title": {
-            "font": (Fonts.FAMILY, Fonts.SIZE_TITLE, "bold"),
-            "text_color": Colors.TEXT_PRIMARY,
-        },
-        "heading": {
-            "font": (Fonts.FAMILY, Fonts.SIZE_XL, "bold"),
-            "text_color": Colors.TEXT_PRIMARY,
-        },
-        "subheading": {
-            "font": (Fonts.FAMILY, Fonts.SIZE_LG),
-            "text_color": Colors.TEXT_PRIMARY,
-        },
-        "normal": {
-            "font": (Fonts.FAMILY, Fonts.SIZE_MD),
-            "text_color": Colors.TEXT_PRIMARY,
-        },
-        "secondary": {
-            "font": (Fonts.FAMILY, Fonts.SIZE_MD),
-            "text_color": Colors.TEXT_SECONDARY,
-        },
-        "muted": {
-            "font": (Fonts.FAMILY, Fonts.SIZE_SM),
-            "text_color": Colors.TEXT_MUTED,
-        },
-        "caption": {
-            "font": (Fonts.FAMILY, Fonts.SIZE_SM),
-            "text_color": Colors.TEXT_SECONDARY,
-        },
-    }
-    
-    style_config = styles.get(style, styles["normal"])
+    style_config = _LABEL_STYLES.get(style, _LABEL_STYLES["normal"])
     
     return ctk.CTkLabel(
         parent,
@@ -175,11 +208,11 @@ def create_entry(
         height=height,
         corner_radius=8,
         border_width=2,
-        border_color=Colors.BORDER,
-        fg_color=Colors.SURFACE_DARK,
-        text_color=Colors.TEXT_PRIMARY,
-        placeholder_text_color=Colors.TEXT_MUTED,
-        font=(Fonts.FAMILY, Fonts.SIZE_MD),
+        border_color=_C_BORDER,
+        fg_color=_C_SURFACE_DARK,
+        text_color=_C_TEXT_PRIMARY,
+        placeholder_text_color=_C_TEXT_MUTED,
+        font=_FONT_MD,
         show=show,
         **kwargs
     )
@@ -198,7 +231,7 @@ def create_card(
     """
     card = ctk.CTkFrame(
         parent,
-        fg_color=Colors.SURFACE_MEDIUM,
+        fg_color=_C_SURFACE_MEDIUM,
         corner_radius=12,
         **kwargs
     )
@@ -210,8 +243,8 @@ def create_card(
         ctk.CTkLabel(
             header,
             text=title,
-            font=(Fonts.FAMILY, Fonts.SIZE_LG, "bold"),
-            text_color=Colors.TEXT_PRIMARY
+            font=_FONT_LG_BOLD,
+            text_color=_C_TEXT_PRIMARY
         ).pack(anchor="w")
     
     content = ctk.CTkFrame(card, fg_color="transparent")
@@ -223,87 +256,253 @@ def create_card(
 def create_separator(parent, orientation: str = "horizontal") -> ctk.CTkFrame:
     """Create a separator line"""
     if orientation == "horizontal":
-        sep = ctk.CTkFrame(parent, height=1, fg_color=Colors.BORDER)
+        sep = ctk.CTkFrame(parent, height=1, fg_color=_C_BORDER)
     else:
-        sep = ctk.CTkFrame(parent, width=1, fg_color=Colors.BORDER)
+        sep = ctk.CTkFrame(parent, width=1, fg_color=_C_BORDER)
     return sep
 
 
+# Message dialog icons per type
+_MESSAGE_ICONS = {
+    "info": ("ℹ", Colors.INFO),
+    "warning": ("⚠", Colors.WARNING),
+    "error": ("✖", Colors.ERROR),
+    "question": ("?", Colors.PRIMARY),
+}
+
+
+class _MessageDialog(ctk.CTkToplevel):
+    """
+    Themed message dialog that does not spin a nested event loop.
+    The Tk loop keeps running while it is open; the result is delivered
+    through the callback when the dialog closes.
+    """
+    
+    def __init__(
+        self,
+        parent,
+        title: str,
+        message: str,
+        msg_type: str = "info",
+        callback: Optional[Callable[[bool], None]] = None
+    ):
+        super().__init__(parent, fg_color=_C_SURFACE_DARK)
+        
+        self.result = False
+        self._callback = callback
+        
+        self.title(title)
+        self.resizable(False, False)
+        self.transient(self.master)
+        self.protocol("WM_DELETE_WINDOW", lambda: self._close(False))
+        
+        icon, color = _MESSAGE_ICONS.get(msg_type, _MESSAGE_ICONS["info"])
+        
+        body = ctk.CTkFrame(self, fg_color="transparent")
+        body.pack(fill="both", expand=True, padx=20, pady=(20, 10))
+        
+        ctk.CTkLabel(
+            body,
+            text=icon,
+            font=_FONT_HEADING,
+            text_color=color
+        ).pack(side="left", padx=(0, 15), anchor="n")
+        
+        ctk.CTkLabel(
+            body,
+            text=message,
+            font=_FONT_MD,
+            text_color=_C_TEXT_PRIMARY,
+            wraplength=360,
+            justify="left"
+        ).pack(side="left", fill="x", expand=True)
+        
+        buttons = ctk.CTkFrame(self, fg_color="transparent")
+        buttons.pack(fill="x", padx=20, pady=(0, 20))
+        
+        if msg_type == "question":
+            create_button(
+                buttons, text="No", style="secondary", width=80,
+                command=lambda: self._close(False)
+            ).pack(side="right")
+            default = create_button(
+                buttons, text="Yes", width=80,
+                command=lambda: self._close(True)
+            )
+            default.pack(side="right", padx=(0, 10))
+        else:
+            default = create_button(
+                buttons, text="OK", width=80,
+                command=lambda: self._close(True)
+            )
+            default.pack(side="right")
+        
+        self.bind("<Return>", lambda e: self._close(True))
+        self.bind("<Escape>", lambda e: self._close(False))
+        
+        self.update_idletasks()
+        center_window(self, self.winfo_reqwidth(), self.winfo_reqheight())
+        default.focus_set()
+        
+        # Remember any modal dialog underneath so it gets its grab back
+        try:
+            self._previous_grab = self.grab_current()
+        except Exception:
+            self._previous_grab = None
+        self._grab_id = None
+        self._grab()
+    
+    def _grab(self):
+        """Make the dialog modal once it is viewable"""
+        self._grab_id = None
+        if not self.winfo_exists():
+            return
+        try:
+            self.grab_set()
+        except Exception:
+            self._grab_id = self.after(50, self._grab)
+    
+    def destroy(self):
+        """Cancel a pending grab retry before the dialog goes away"""
+        if self._grab_id is not None:
+            self.after_cancel(self._grab_id)
+            self._grab_id = None
+        super().destroy()
+    
+    def _close(self, result: bool):
+        """Close the dialog and deliver the result"""
+        self.result = result
+        try:
+            self.grab_release()
+        except Exception:
+            pass
+        self.destroy()
+        
+        previous = self._previous_grab
+        if previous is not None:
+            try:
+                if previous.winfo_exists():
+                    previous.grab_set()
+                    previous.focus_set()
+            except Exception:
+                pass
+        
+        if self._callback:
+            self._callback(result)
+
+
 def show_message(
     title: str,
     message: str,
-    msg_type: str = "info"
+    msg_type: str = "info",
+    callback: Optional[Callable[[bool], None]] = None,
+    parent=None
 ):
     """
-    Show a message dialog.
+    Show a message dialog without blocking the event loop.
     
     Args:
         title: Dialog title
         message: Dialog message
         msg_type: Type - "info", "warning", "error", "question"
+        callback: Optional handler called with the result on close
+        parent: Optional parent window (defaults to the root window)
     """
-    if msg_type == "info":
-        messagebox.showinfo(title, message)
-    elif msg_type == "warning":
-        messagebox.showwarning(title, message)
-    elif msg_type == "error":
-        messagebox.showerror(title, message)
-    elif msg_type == "question":
-        return messagebox.askyesno(title, message)
+    if msg_type == "question":
+        return ask_confirmation(title, message, callback=callback, parent=parent)
+    
+    _MessageDialog(parent, title, message, msg_type, callback=callback)
 
 
-def ask_confirmation(title: str, message: str) -> bool:
-    """Show a yes/no confirmation dialog"""
-    return messagebox.askyesno(title, message)
+def ask_confirmation(
+    title: str,
+    message: str,
+    callback: Optional[Callable[[bool], None]] = None,
+    parent=None
+) -> Optional[bool]:
+    """
+    Show a yes/no confirmation dialog.
+    With a callback the dialog is non-blocking and returns None;
+    otherwise waits for the dialog to close and returns the answer.
+    """
+    dialog = _MessageDialog(parent, title, message, "question", callback=callback)
+    if callback:
+        return None
+    
+    dialog.wait_window()
+    return dialog.result
 
 
 def format_mac(mac: str) -> str:
     """Format MAC address consistently"""
+    if _MAC_CANONICAL.fullmatch(mac):
+        return mac
     mac = mac.upper().replace("-", ":").replace(".", ":")
     return mac
 
 
+# Strength buckets, weakest first (see _signal_bucket)
+_SIGNAL_COLORS = (
+    Colors.SIGNAL_POOR, Colors.SIGNAL_WEAK, Colors.SIGNAL_FAIR,
+    Colors.SIGNAL_GOOD, Colors.SIGNAL_EXCELLENT,
+)
+_SIGNAL_BARS = ("░░░░", "█░░░", "██░░", "███░", "████")
+
+# Already-normalized MAC, as produced by the drivers
+_MAC_CANONICAL = re.compile(r'[0-9A-F]{2}(?::[0-9A-F]{2}){5}')
+
+# Security tokens, strongest first
+_SECURITY_PATTERN = re.compile(r'WPA3|WPA2|WPA|WEP')
+_SECURITY_ORDER = ('WPA3', 'WPA2', 'WPA', 'WEP')
+_SECURITY_COLORS = (Colors.SEC_WPA3, Colors.SEC_WPA2, Colors.SEC_WPA, Colors.SEC_WEP)
+_SEC_OPEN_COLOR = Colors.SEC_OPEN
+
+
+def _signal_bucket(signal_dbm: int) -> int:
+    """Map dBm to a 0 (poor) .. 4 (excellent) strength bucket"""
+    return min(4, max(0, (signal_dbm + 90) // 10))
+
+
 def format_signal(signal_dbm: int) -> str:
     """Format signal strength with indicator"""
-    if signal_dbm >= -50:
-        indicator = "████"
-    elif signal_dbm >= -60:
-        indicator = "███░"
-    elif signal_dbm >= -70:
-        indicator = "██░░"
-    elif signal_dbm >= -80:
-        indicator = "█░░░"
-    else:
-        indicator = "░░░░"
-    
-    return f"{signal_dbm} dBm {indicator}"
+    return f"{signal_dbm} dBm {_SIGNAL_BARS[_signal_bucket(signal_dbm)]}"
 
 
 def get_signal_color(signal_dbm: int) -> str:
     """Get color for signal strength"""
-    if signal_dbm >= -50:
-        return Colors.SIGNAL_EXCELLENT
-    elif signal_dbm >= -60:
-        return Colors.SIGNAL_GOOD
-    elif signal_dbm >= -70:
-        return Colors.SIGNAL_FAIR
-    elif signal_dbm >= -80:
-        return Colors.SIGNAL_WEAK
-    return Colors.SIGNAL_POOR
+    return _SIGNAL_COLORS[min(4, max(0, (signal_dbm + 90) // 10))]
 
 
+@lru_cache(maxsize=128)
 def get_security_color(security: str) -> str:
-    """Get color for security type"""
-    security = security.upper()
-    if 'WPA3' in security:
-        return Colors.SEC_WPA3
-    elif 'WPA2' in security:
-        return Colors.SEC_WPA2
-    elif 'WPA' in security:
-        return Colors.SEC_WPA
-    elif 'WEP' in security:
-        return Colors.SEC_WEP
-    return Colors.SEC_OPEN
+    """Get color for security type (drivers upper-case security strings)"""
+    found = _SECURITY_PATTERN.findall(security)
+    if not found:
+        return _SEC_OPEN_COLOR
+    return _SECURITY_COLORS[min(_SECURITY_ORDER.index(token) for token in found)]
+
+
+def annotate_networks(networks: List[NetworkInfo]) -> List[Tuple[str, str, str]]:
+    """
+    Derive display styling for scan results in one pass.
+    Returns (signal_color, signal_bars, security_color) per network, in order.
+    """
+    if NUMPY_AVAILABLE and networks:
+        signals = np.fromiter(
+            (n.signal for n in networks), dtype=np.int16, count=len(networks)
+        )
+        buckets = np.clip((signals + 90) // 10, 0, 4)
+        colors = np.array(_SIGNAL_COLORS, dtype=object)[buckets]
+        bars = np.array(_SIGNAL_BARS, dtype=object)[buckets]
+    else:
+        buckets = [_signal_bucket(n.signal) for n in networks]
+        colors = [_SIGNAL_COLORS[b] for b in buckets]
+        bars = [_SIGNAL_BARS[b] for b in buckets]
+    
+    return [
+        (color, bar, get_security_color(network.security))
+        for network, color, bar in zip(networks, colors, bars)
+    ]
 
 
 __all__ = [
@@ -319,4 +518,6 @@ __all__ = [
     'format_signal',
     'get_signal_color',
     'get_security_color',
+    'annotate_networks',
+    'get_font',
 ]
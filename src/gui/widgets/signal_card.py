@@ -3,10 +3,72 @@ WiFi Tester Pro v6.0 - Signal Card Widgets
 Visual cards for displaying WiFi signal and network information
 """
 
+import queue
+from bisect import insort
 import customtkinter as ctk
-from typing import Optional, Dict, Any, Callable
+from typing import Optional, Dict, Any, Callable, List, Iterable
 
 from ...settings import Colors, Fonts, Layout, NetworkInfo
+from ..utils import get_font
+
+
+# =============================================================================
+# SIGNAL CLASSIFICATION TABLES
+# =============================================================================
+def _classify_signal(dbm: int):
+    """(active bars, color, quality) for the 5-bar SignalCard"""
+    if dbm >= -50:
+        return 5, Colors.SUCCESS, "Excellent"
+    elif dbm >= -60:
+        return 4, Colors.SUCCESS, "Good"
+    elif dbm >= -70:
+        return 3, Colors.WARNING, "Fair"
+    elif dbm >= -80:
+        return 2, Colors.WARNING, "Weak"
+    elif dbm >= -90:
+        return 1, Colors.ERROR, "Very Weak"
+    return 0, Colors.ERROR, "No Signal"
+
+
+def _classify_mini_signal(dbm: int):
+    """(active bars, color) for the 4-bar NetworkCard indicator"""
+    if dbm >= -50:
+        return 4, Colors.SUCCESS
+    elif dbm >= -60:
+        return 3, Colors.SUCCESS
+    elif dbm >= -70:
+        return 2, Colors.WARNING
+    elif dbm >= -80:
+        return 1, Colors.WARNING
+    return 0, Colors.ERROR
+
+
+# Indexed by _signal_index(dbm): -30 dBm and stronger -> 0, -100 dBm and weaker -> 70
+_SIGNAL_TABLE = tuple(_classify_signal(-30 - i) for i in range(71))
+_MINI_SIGNAL_TABLE = tuple(_classify_mini_signal(-30 - i) for i in range(71))
+
+
+def _signal_index(dbm: int) -> int:
+    """Clamp dBm into an index for the signal tables"""
+    return max(0, min(70, -dbm - 30))
+
+
+# Security badge icons keyed by the part before the first "-"
+_SEC_ICONS = {
+    "WPA3": "🔐",
+    "WPA2": "🔒",
+    "WPA": "🔓",
+    "WEP": "⚠️",
+    "OPEN": "⚪",
+}
+
+
+def _display_key(network: NetworkInfo) -> tuple:
+    """Fields a NetworkCard renders; last_seen etc. change every scan and are ignored"""
+    return (
+        network.ssid, network.bssid, network.signal, network.channel,
+        network.frequency, network.security,
+    )
 
 
 class SignalCard(ctk.CTkFrame):
@@ -38,7 +100,7 @@ class SignalCard(ctk.CTkFrame):
         ctk.CTkLabel(
             self,
             text=self._title,
-            font=(Fonts.FAMILY, Fonts.SIZE_SM),
+            font=get_font(Fonts.SIZE_SM),
             text_color=Colors.TEXT_SECONDARY
         ).pack(padx=Layout.PADDING_SM, pady=(Layout.PADDING_SM, 0), anchor="w")
         
@@ -62,14 +124,14 @@ class SignalCard(ctk.CTkFrame):
                 corner_radius=2
             )
             bar.pack(side="left", padx=2, anchor="s")
-            bar.pack_propagate(False)
             self._bars.append(bar)
+        self._bar_colors = [Colors.SURFACE_LIGHT] * len(self._bars)
         
         # dBm label
         self._dbm_label = ctk.CTkLabel(
             signal_frame,
             text="-100 dBm",
-            font=(Fonts.MONO, Fonts.SIZE_XL, "bold"),
+            font=get_font(Fonts.SIZE_XL, "bold", family=Fonts.MONO),
             text_color=Colors.TEXT_PRIMARY
         )
         self._dbm_label.pack(side="right", padx=Layout.PADDING_SM)
@@ -78,10 +140,13 @@ class SignalCard(ctk.CTkFrame):
         self._quality_label = ctk.CTkLabel(
             self,
             text="No Signal",
-            font=(Fonts.FAMILY, Fonts.SIZE_SM),
+            font=get_font(Fonts.SIZE_SM),
             text_color=Colors.TEXT_MUTED
         )
         self._quality_label.pack(padx=Layout.PADDING_SM, pady=(0, Layout.PADDING_SM))
+        
+        # Last applied (text, color), used to skip redundant label updates
+        self._last_label_state = None
     
     def set_signal(self, dbm: int):
         """
@@ -93,41 +158,22 @@ class SignalCard(ctk.CTkFrame):
         self._signal_dbm = dbm
         
         # Determine bars to light up
-        if dbm >= -50:
-            active_bars = 5
-            color = Colors.SUCCESS
-            quality = "Excellent"
-        elif dbm >= -60:
-            active_bars = 4
-            color = Colors.SUCCESS
-            quality = "Good"
-        elif dbm >= -70:
-            active_bars = 3
-            color = Colors.WARNING
-            quality = "Fair"
-        elif dbm >= -80:
-            active_bars = 2
-            color = Colors.WARNING
-            quality = "Weak"
-        elif dbm >= -90:
-            active_bars = 1
-            color = Colors.ERROR
-            quality = "Very Weak"
-        else:
-            active_bars = 0
-            color = Colors.ERROR
-            quality = "No Signal"
+        active_bars, color, quality = _SIGNAL_TABLE[_signal_index(dbm)]
         
-        # Update bars
+        # Update bars whose color actually changed
+        bar_colors = self._bar_colors
         for i, bar in enumerate(self._bars):
-            if i < active_bars:
-                bar.configure(fg_color=color)
-            else:
-                bar.configure(fg_color=Colors.SURFACE_LIGHT)
+            bar_color = color if i < active_bars else Colors.SURFACE_LIGHT
+            if bar_colors[i] != bar_color:
+                bar.configure(fg_color=bar_color)
+                bar_colors[i] = bar_color
         
         # Update labels
-        self._dbm_label.configure(text=f"{dbm} dBm", text_color=color)
-        self._quality_label.configure(text=quality, text_color=color)
+        label_state = (dbm, quality, color)
+        if label_state != self._last_label_state:
+            self._last_label_state = label_state
+            self._dbm_label.configure(text=f"{dbm} dBm", text_color=color)
+            self._quality_label.configure(text=quality, text_color=color)
 
 
 class NetworkCard(ctk.CTkFrame):
@@ -157,6 +203,9 @@ class NetworkCard(ctk.CTkFrame):
         self._on_connect = on_connect
         self._on_analyze = on_analyze
         self._selected = False
+        self._last_key = None
+        self._current_border = (Colors.BORDER, 1)
+        self._is_connected = False
         
         self._create_ui()
         
@@ -169,27 +218,25 @@ class NetworkCard(ctk.CTkFrame):
     
     def _create_ui(self):
         """Create network card UI"""
+        # Build the whole widget tree first, then lay it out in one pass
+        
         # Main content
         content = ctk.CTkFrame(self, fg_color="transparent")
-        content.pack(fill="both", expand=True, padx=Layout.PADDING_MD, pady=Layout.PADDING_MD)
         
         # Top row: SSID and Signal
         top_row = ctk.CTkFrame(content, fg_color="transparent")
-        top_row.pack(fill="x")
         
         # SSID
         self._ssid_label = ctk.CTkLabel(
             top_row,
             text="Unknown Network",
-            font=(Fonts.FAMILY, Fonts.SIZE_LG, "bold"),
+            font=get_font(Fonts.SIZE_LG, "bold"),
             text_color=Colors.TEXT_PRIMARY,
             anchor="w"
         )
-        self._ssid_label.pack(side="left", fill="x", expand=True)
         
         # Signal indicator (small bars)
         self._signal_frame = ctk.CTkFrame(top_row, fg_color="transparent")
-        self._signal_frame.pack(side="right")
         
         self._mini_bars = []
         for i, height in enumerate([6, 9, 12, 15]):
@@ -200,77 +247,69 @@ class NetworkCard(ctk.CTkFrame):
                 fg_color=Colors.SURFACE_LIGHT,
                 corner_radius=1
             )
-            bar.pack(side="left", padx=1, anchor="s")
-            bar.pack_propagate(False)
             self._mini_bars.append(bar)
+        self._mini_bar_colors = [Colors.SURFACE_LIGHT] * len(self._mini_bars)
         
         # Middle row: Details
         details_row = ctk.CTkFrame(content, fg_color="transparent")
-        details_row.pack(fill="x", pady=(Layout.PADDING_SM, 0))
         
         # Security badge
         self._security_badge = ctk.CTkLabel(
             details_row,
             text="🔒 WPA2",
-            font=(Fonts.FAMILY, Fonts.SIZE_XS),
+            font=get_font(Fonts.SIZE_XS),
             text_color=Colors.TEXT_SECONDARY,
             fg_color=Colors.SURFACE_LIGHT,
             corner_radius=4,
             padx=8,
             pady=2
         )
-        self._security_badge.pack(side="left")
         
         # Channel
         self._channel_label = ctk.CTkLabel(
             details_row,
             text="CH: --",
-            font=(Fonts.FAMILY, Fonts.SIZE_XS),
+            font=get_font(Fonts.SIZE_XS),
             text_color=Colors.TEXT_MUTED
         )
-        self._channel_label.pack(side="left", padx=(Layout.PADDING_SM, 0))
         
         # Frequency
         self._freq_label = ctk.CTkLabel(
             details_row,
             text="2.4 GHz",
-            font=(Fonts.FAMILY, Fonts.SIZE_XS),
+            font=get_font(Fonts.SIZE_XS),
             text_color=Colors.TEXT_MUTED
         )
-        self._freq_label.pack(side="left", padx=(Layout.PADDING_SM, 0))
         
         # dBm
         self._dbm_label = ctk.CTkLabel(
             details_row,
             text="-100 dBm",
-            font=(Fonts.MONO, Fonts.SIZE_XS),
+            font=get_font(Fonts.SIZE_XS, family=Fonts.MONO),
             text_color=Colors.TEXT_MUTED
         )
-        self._dbm_label.pack(side="right")
+        self._last_dbm_state = None
         
         # Bottom row: BSSID and Actions
         bottom_row = ctk.CTkFrame(content, fg_color="transparent")
-        bottom_row.pack(fill="x", pady=(Layout.PADDING_SM, 0))
         
         # BSSID
         self._bssid_label = ctk.CTkLabel(
             bottom_row,
             text="BSSID: --:--:--:--:--:--",
-            font=(Fonts.MONO, Fonts.SIZE_XS),
+            font=get_font(Fonts.SIZE_XS, family=Fonts.MONO),
             text_color=Colors.TEXT_MUTED,
             anchor="w"
         )
-        self._bssid_label.pack(side="left")
         
         # Action buttons frame
         actions = ctk.CTkFrame(bottom_row, fg_color="transparent")
-        actions.pack(side="right")
         
         # Analyze button
         self._analyze_btn = ctk.CTkButton(
             actions,
             text="Analyze",
-            font=(Fonts.FAMILY, Fonts.SIZE_XS),
+            font=get_font(Fonts.SIZE_XS),
             width=60,
             height=24,
             fg_color="transparent",
@@ -278,13 +317,12 @@ class NetworkCard(ctk.CTkFrame):
             text_color=Colors.PRIMARY,
             command=self._handle_analyze
         )
-        self._analyze_btn.pack(side="left", padx=(0, 5))
         
         # Connect button
         self._connect_btn = ctk.CTkButton(
             actions,
             text="Connect",
-            font=(Fonts.FAMILY, Fonts.SIZE_XS),
+            font=get_font(Fonts.SIZE_XS),
             width=70,
             height=24,
             fg_color=Colors.PRIMARY,
@@ -292,71 +330,110 @@ class NetworkCard(ctk.CTkFrame):
             text_color=Colors.TEXT_PRIMARY,
             command=self._handle_connect
         )
+        
+        # Layout: pack leaves first and attach the content frame last, so
+        # the card's geometry is computed once for the finished subtree
+        self._ssid_label.pack(side="left", fill="x", expand=True)
+        for bar in self._mini_bars:
+            bar.pack(side="left", padx=1, anchor="s")
+        self._signal_frame.pack(side="right")
+        
+        self._security_badge.pack(side="left")
+        self._channel_label.pack(side="left", padx=(Layout.PADDING_SM, 0))
+        self._freq_label.pack(side="left", padx=(Layout.PADDING_SM, 0))
+        self._dbm_label.pack(side="right")
+        
+        self._bssid_label.pack(side="left")
+        self._analyze_btn.pack(side="left", padx=(0, 5))
         self._connect_btn.pack(side="left")
+        actions.pack(side="right")
+        
+        top_row.pack(fill="x")
+        details_row.pack(fill="x", pady=(Layout.PADDING_SM, 0))
+        bottom_row.pack(fill="x", pady=(Layout.PADDING_SM, 0))
+        content.pack(fill="both", expand=True, padx=Layout.PADDING_MD, pady=Layout.PADDING_MD)
     
     def update_network(self, network: NetworkInfo):
         """Update card with network information"""
         self._network = network
         
+        # Nothing visible changed since the last update
+        key = _display_key(network)
+        if key == self._last_key:
+            return
+        self._last_key = key
+        
         # Update SSID
-        ssid_display = network.ssid if network.ssid else "<Hidden Network>"
-        if network.is_connected:
-            ssid_display = f"✓ {ssid_display}"
-        self._ssid_label.configure(text=ssid_display)
+        self._update_ssid_label()
         
         # Update signal bars
-        signal = network.signal_strength
-        if signal >= -50:
-            active = 4
-            color = Colors.SUCCESS
-        elif signal >= -60:
-            active = 3
-            color = Colors.SUCCESS
-        elif signal >= -70:
-            active = 2
-            color = Colors.WARNING
-        elif signal >= -80:
-            active = 1
-            color = Colors.WARNING
-        else:
-            active = 0
-            color = Colors.ERROR
+        active, color = _MINI_SIGNAL_TABLE[_signal_index(network.signal)]
         
+        bar_colors = self._mini_bar_colors
         for i, bar in enumerate(self._mini_bars):
-            bar.configure(fg_color=color if i < active else Colors.SURFACE_LIGHT)
+            bar_color = color if i < active else Colors.SURFACE_LIGHT
+            if bar_colors[i] != bar_color:
+                bar.configure(fg_color=bar_color)
+                bar_colors[i] = bar_color
         
         # Update security badge
-        security_icons = {
-            "WPA3": "🔐",
-            "WPA2": "🔒",
-            "WPA": "🔓",
-            "WEP": "⚠️",
-            "Open": "⚪",
-        }
-        icon = security_icons.get(network.security.split("-")[0] if "-" in network.security else network.security, "🔒")
+        root, _, _ = network.security.partition("-")
+        icon = _SEC_ICONS.get(root, "🔒")
         self._security_badge.configure(text=f"{icon} {network.security}")
         
         # Update other fields
         self._channel_label.configure(text=f"CH: {network.channel}")
         self._freq_label.configure(text=network.frequency)
-        self._dbm_label.configure(text=f"{network.signal_strength} dBm", text_color=color)
+        if self._last_dbm_state != (network.signal, color):
+            self._last_dbm_state = (network.signal, color)
+            self._dbm_label.configure(text=f"{network.signal} dBm", text_color=color)
         self._bssid_label.configure(text=f"BSSID: {network.bssid}")
+    
+    def _update_ssid_label(self):
+        """Render the SSID with the connected marker"""
+        network = self._network
+        ssid_display = network.ssid if network and network.ssid else "<Hidden Network>"
+        if self._is_connected:
+            ssid_display = f"✓ {ssid_display}"
+        self._ssid_label.configure(text=ssid_display)
+    
+    def _idle_border(self) -> str:
+        """Border color when the card is neither hovered nor selected"""
+        return Colors.SUCCESS if self._is_connected else Colors.BORDER
+    
+    def set_connected(self, connected: bool):
+        """Update connection state without re-rendering the network fields"""
+        if connected == self._is_connected:
+            return
+        self._is_connected = connected
+        
+        self._update_ssid_label()
         
         # Update connect button
-        if network.is_connected:
+        if connected:
             self._connect_btn.configure(
                 text="Disconnect",
                 fg_color=Colors.SURFACE_LIGHT,
                 hover_color=Colors.ERROR
             )
-            self.configure(border_color=Colors.SUCCESS)
         else:
             self._connect_btn.configure(
                 text="Connect",
                 fg_color=Colors.PRIMARY,
                 hover_color=Colors.PRIMARY_HOVER
             )
-            self.configure(border_color=Colors.BORDER)
+        
+        if not self._selected:
+            self._set_border(self._idle_border())
+    
+    def _set_border(self, color: str, width: Optional[int] = None):
+        """Apply border color/width, skipping the redraw when unchanged"""
+        if width is None:
+            width = self._current_border[1]
+        if self._current_border == (color, width):
+            return
+        self._current_border = (color, width)
+        self.configure(border_color=color, border_width=width)
     
     def _handle_connect(self):
         """Handle connect button click"""
@@ -371,23 +448,20 @@ class NetworkCard(ctk.CTkFrame):
     def _on_enter(self, event):
         """Mouse enter hover effect"""
         if not self._selected:
-            self.configure(border_color=Colors.PRIMARY)
+            self._set_border(Colors.PRIMARY)
     
     def _on_leave(self, event):
         """Mouse leave hover effect"""
         if not self._selected:
-            if self._network and self._network.is_connected:
-                self.configure(border_color=Colors.SUCCESS)
-            else:
-                self.configure(border_color=Colors.BORDER)
+            self._set_border(self._idle_border())
     
     def set_selected(self, selected: bool):
         """Set card selection state"""
         self._selected = selected
         if selected:
-            self.configure(border_color=Colors.PRIMARY, border_width=2)
+            self._set_border(Colors.PRIMARY, 2)
         else:
-            self.configure(border_color=Colors.BORDER, border_width=1)
+            self._set_border(self._idle_border(), 1)
     
     def get_network(self) -> Optional[NetworkInfo]:
         """Get the network info"""
@@ -397,9 +471,16 @@ class NetworkCard(ctk.CTkFrame):
 class NetworkList(ctk.CTkScrollableFrame):
     """
     Scrollable list of NetworkCard widgets.
-    Manages selection and filtering.
+    Manages selection and filtering. Only the cards covering the visible
+    scroll window are packed; spacer frames stand in for the rows above
+    and below, and cards scrolled out of view go back to a reuse pool.
     """
     
+    CARD_PITCH = 110  # estimated card height + spacing until measured
+    OVERSCAN = 2
+    DRAIN_INTERVAL = 50  # ms between inbox drains
+    MAX_NEW_CARDS = 20  # card widgets created per render tick
+    
     def __init__(
         self,
         parent,
@@ -417,40 +498,240 @@ class NetworkList(ctk.CTkScrollableFrame):
         self._on_select = on_select
         self._on_connect = on_connect
         self._on_analyze = on_analyze
-        self._cards: Dict[str, NetworkCard] = {}
+        self._networks: Dict[str, NetworkInfo] = {}
+        self._network_order: List[str] = []
+        self._cards: Dict[str, NetworkCard] = {}  # bssid -> bound card
+        self._pool: List[NetworkCard] = []
         self._selected_bssid: Optional[str] = None
+        self._connected: set = set()
+        
+        self._card_pitch = self.CARD_PITCH
+        self._rendered = None
+        self._render_scheduled = False
+        
+        self._top_spacer = ctk.CTkFrame(self, height=1, fg_color="transparent")
+        self._bottom_spacer = ctk.CTkFrame(self, height=1, fg_color="transparent")
+        
+        # One delegated click handler shared by every card via a bindtag
+        self._click_tag = f"NetworkList{id(self)}"
+        self.bind_class(self._click_tag, "<Button-1>", self._on_click)
+        
+        # Re-render the visible slice whenever the view scrolls or resizes
+        self._parent_canvas.configure(yscrollcommand=self._on_yscroll)
+        self._parent_canvas.bind("<Configure>", self._schedule_render, add="+")
+        
+        # Batches pushed from worker threads, drained on the UI thread
+        self._inbox: queue.Queue = queue.Queue()
+        self._drain_id = self.after(self.DRAIN_INTERVAL, self._drain)
     
-    def add_network(self, network: NetworkInfo):
-        """Add a network to the list"""
-        if network.bssid in self._cards:
-            # Update existing card
-            self._cards[network.bssid].update_network(network)
+    def _add_click_tag(self, widget):
+        """Route clicks on a card and its children to the shared handler"""
+        widget.bindtags((self._click_tag,) + widget.bindtags())
+        for child in widget.winfo_children():
+            self._add_click_tag(child)
+    
+    def _on_click(self, event):
+        """Find the card under the click and select its network"""
+        widget = event.widget
+        while widget is not None and not isinstance(widget, NetworkCard):
+            widget = getattr(widget, "master", None)
+        
+        if widget is not None and widget.get_network():
+            self._handle_select(widget.get_network())
+    
+    # ==========================================================================
+    # Virtualization
+    # ==========================================================================
+    
+    def _on_yscroll(self, first, last):
+        """Forward scroll position to the scrollbar and refresh the slice"""
+        self._scrollbar.set(first, last)
+        self._schedule_render()
+    
+    def _schedule_render(self, event=None):
+        """Coalesce render requests into one idle callback"""
+        if not self._render_scheduled:
+            self._render_scheduled = True
+            self.after_idle(self._render)
+    
+    def _invalidate(self):
+        """Force the next render to rebind the visible slice"""
+        self._rendered = None
+        self._schedule_render()
+    
+    def _visible_range(self):
+        """Index range of networks covering the viewport plus overscan"""
+        total = len(self._network_order)
+        if not total:
+            return 0, 0
+        
+        first = int(self._parent_canvas.yview()[0] * total)
+        count = self._parent_canvas.winfo_height() // self._card_pitch + 1
+        start = max(0, first - self.OVERSCAN)
+        return start, min(total, first + count + self.OVERSCAN)
+    
+    def _bind_card(self, network: NetworkInfo) -> NetworkCard:
+        """Take a card from the pool (or create one) and show a network"""
+        if self._pool:
+            card = self._pool.pop()
         else:
-            # Create new card
             card = NetworkCard(
                 self,
-                network=network,
                 on_connect=self._on_connect,
                 on_analyze=self._on_analyze
             )
-            card.pack(fill="x", pady=(0, Layout.PADDING_SM))
-            card.bind("<Button-1>", lambda e, n=network: self._handle_select(n))
-            self._cards[network.bssid] = card
+            self._add_click_tag(card)
+        
+        card.update_network(network)
+        card.set_connected(network.bssid in self._connected)
+        card.set_selected(network.bssid == self._selected_bssid)
+        self._cards[network.bssid] = card
+        return card
+    
+    def _release_card(self, bssid: str):
+        """Unpack a bound card and return it to the pool"""
+        card = self._cards.pop(bssid)
+        card.pack_forget()
+        self._pool.append(card)
     
-    def update_networks(self, networks: list):
-        """Update the entire network list"""
-        # Get current BSSIDs
-        current_bssids = set(self._cards.keys())
-        new_bssids = {n.bssid for n in networks}
+    def _render(self):
+        """Pack cards for the visible slice between the two spacers"""
+        self._render_scheduled = False
+        
+        start, end = self._visible_range()
+        wanted = self._network_order[start:end]
+        state = (start, tuple(wanted))
+        if state == self._rendered:
+            return
+        self._rendered = state
+        
+        wanted_set = set(wanted)
+        for bssid in [b for b in self._cards if b not in wanted_set]:
+            self._release_card(bssid)
+        
+        # Repack in display order
+        self._top_spacer.pack_forget()
+        self._bottom_spacer.pack_forget()
+        for card in self._cards.values():
+            card.pack_forget()
+        
+        pitch = self._card_pitch
+        self._top_spacer.configure(height=max(1, start * pitch))
+        self._top_spacer.pack(fill="x")
+        
+        created = 0
+        for bssid in wanted:
+            card = self._cards.get(bssid)
+            if card is None:
+                if not self._pool:
+                    if created >= self.MAX_NEW_CARDS:
+                        # Spread the rest of the slice over the next ticks
+                        self._rendered = None
+                        self.after(16, self._schedule_render)
+                        break
+                    created += 1
+                card = self._bind_card(self._networks[bssid])
+            card.pack(fill="x", pady=(0, Layout.PADDING_SM))
         
-        # Remove old cards
-        for bssid in current_bssids - new_bssids:
-            self._cards[bssid].destroy()
-            del self._cards[bssid]
+        remaining = len(self._network_order) - end
+        self._bottom_spacer.configure(height=max(1, remaining * pitch))
+        self._bottom_spacer.pack(fill="x")
         
-        # Add/update networks
+        # Refine the pitch estimate from a real card (spacers use unscaled units)
+        if wanted:
+            height = self._cards[wanted[0]].winfo_reqheight()
+            if height > 1:
+                self._card_pitch = int(height / self._get_widget_scaling()) + Layout.PADDING_SM
+    
+    def _drain(self):
+        """Apply the newest submitted batch; older pending batches are dropped"""
+        latest = None
+        while True:
+            try:
+                latest = self._inbox.get_nowait()
+            except queue.Empty:
+                break
+        
+        if latest is not None:
+            self.update_networks(latest)
+        
+        self._drain_id = self.after(self.DRAIN_INTERVAL, self._drain)
+    
+    def destroy(self):
+        """Stop draining the inbox before the widget goes away"""
+        if self._drain_id is not None:
+            self.after_cancel(self._drain_id)
+            self._drain_id = None
+        super().destroy()
+    
+    # ==========================================================================
+    # Public API
+    # ==========================================================================
+    
+    def submit_networks(self, networks: Iterable[NetworkInfo]):
+        """Queue a full network list for display; safe to call from any thread"""
+        self._inbox.put(list(networks))
+    
+    def add_network(self, network: NetworkInfo):
+        """Add a network to the list, keeping the strongest signal first"""
+        bssid = network.bssid
+        previous = self._networks.get(bssid)
+        self._networks[bssid] = network
+        
+        card = self._cards.get(bssid)
+        if previous is not None and previous.signal == network.signal:
+            # Same position; only the bound card (if any) needs refreshing
+            if card is not None:
+                card.update_network(network)
+            return
+        
+        if previous is not None:
+            self._network_order.remove(bssid)
+        insort(self._network_order, bssid, key=self._order_key)
+        
+        if card is not None:
+            card.update_network(network)
+        self._invalidate()
+    
+    def _order_key(self, bssid: str) -> int:
+        """Sort key for _network_order: strongest signal first"""
+        return -self._networks[bssid].signal
+    
+    def update_networks(self, networks: Iterable[NetworkInfo]):
+        """Update the entire network list (iterates networks exactly once)"""
+        new: Dict[str, NetworkInfo] = {}
+        order: List[str] = []
+        
+        # Bound cards only re-render when their data changed
         for network in networks:
-            self.add_network(network)
+            bssid = network.bssid
+            if bssid not in new:
+                order.append(bssid)
+            new[bssid] = network
+            
+            card = self._cards.get(bssid)
+            if card is not None and network is not card.get_network():
+                card.update_network(network)
+        
+        # Return cards for vanished networks to the pool
+        for bssid in [b for b in self._cards if b not in new]:
+            self._release_card(bssid)
+        
+        self._networks = new
+        order.sort(key=self._order_key)
+        self._network_order = order
+        self._invalidate()
+    
+    def set_connected(self, bssid: str, connected: bool):
+        """Mark a network as connected/disconnected"""
+        if connected:
+            self._connected.add(bssid)
+        else:
+            self._connected.discard(bssid)
+        
+        card = self._cards.get(bssid)
+        if card is not None:
+            card.set_connected(connected)
     
     def _handle_select(self, network: NetworkInfo):
         """Handle card selection"""
@@ -460,22 +741,25 @@ class NetworkList(ctk.CTkScrollableFrame):
         
         # Select new
         self._selected_bssid = network.bssid
-        self._cards[network.bssid].set_selected(True)
+        if network.bssid in self._cards:
+            self._cards[network.bssid].set_selected(True)
         
         if self._on_select:
             self._on_select(network)
     
     def clear(self):
         """Clear all networks"""
-        for card in self._cards.values():
-            card.destroy()
-        self._cards.clear()
+        for bssid in list(self._cards):
+            self._release_card(bssid)
+        self._networks.clear()
+        self._network_order.clear()
         self._selected_bssid = None
+        self._invalidate()
     
     def get_selected(self) -> Optional[NetworkInfo]:
         """Get currently selected network"""
-        if self._selected_bssid and self._selected_bssid in self._cards:
-            return self._cards[self._selected_bssid].get_network()
+        if self._selected_bssid:
+            return self._networks.get(self._selected_bssid)
         return None
 
 
@@ -3,12 +3,14 @@ WiFi Tester Pro v6.0 - Terminal Widget
 Console-style log viewer widget
 """
 
+import time
 import customtkinter as ctk
-from typing import Optional, List
-from datetime import datetime
+from collections import deque
+from typing import Optional, List, Deque
 
 from ...settings import Colors, Fonts, Layout
 from ...core.logger import LogEntry
+from ..utils import get_font
 
 
 class TerminalWidget(ctk.CTkFrame):
@@ -17,6 +19,22 @@ class TerminalWidget(ctk.CTkFrame):
     Supports colored text and auto-scrolling.
     """
     
+    SCROLL_INTERVAL = 0.033  # seconds between see("end") calls
+    
+    _LEVEL_PREFIX = {
+        "DEBUG": "[DBG]",
+        "INFO": "[INF]",
+        "WARNING": "[WRN]",
+        "ERROR": "[ERR]",
+        "CRITICAL": "[CRT]",
+    }
+    
+    # Keys that move the cursor/selection without editing
+    _NAV_KEYS = frozenset((
+        "Left", "Right", "Up", "Down", "Home", "End", "Prior", "Next",
+        "Shift_L", "Shift_R", "Control_L", "Control_R",
+    ))
+    
     def __init__(
         self,
         parent,
@@ -32,10 +50,19 @@ class TerminalWidget(ctk.CTkFrame):
         )
         
         self._max_lines = max_lines
+        self._slack = max_lines // 4
         self._show_timestamp = show_timestamp
         self._line_count = 0
         self._auto_scroll = True
         
+        # Lines waiting for the next coalesced flush
+        self._pending: Deque[str] = deque()
+        self._flush_scheduled = False
+        
+        # Auto-scroll throttling
+        self._last_see = 0.0
+        self._see_scheduled = False
+        
         self._create_ui()
     
     def _create_ui(self):
@@ -48,7 +75,7 @@ class TerminalWidget(ctk.CTkFrame):
         ctk.CTkLabel(
             header,
             text="📟 Terminal",
-            font=(Fonts.FAMILY, Fonts.SIZE_SM),
+            font=get_font(Fonts.SIZE_SM),
             text_color=Colors.TEXT_SECONDARY
         ).pack(side="left", padx=10)
         
@@ -57,7 +84,7 @@ class TerminalWidget(ctk.CTkFrame):
         ctk.CTkCheckBox(
             header,
             text="Auto-scroll",
-            font=(Fonts.FAMILY, Fonts.SIZE_SM),
+            font=get_font(Fonts.SIZE_SM),
             variable=self._autoscroll_var,
             command=self._toggle_autoscroll,
             fg_color=Colors.PRIMARY,
@@ -69,7 +96,7 @@ class TerminalWidget(ctk.CTkFrame):
         ctk.CTkButton(
             header,
             text="Clear",
-            font=(Fonts.FAMILY, Fonts.SIZE_SM),
+            font=get_font(Fonts.SIZE_SM),
             width=60,
             height=25,
             fg_color="transparent",
@@ -78,20 +105,20 @@ class TerminalWidget(ctk.CTkFrame):
             command=self.clear
         ).pack(side="right", padx=5)
         
-        # Text area
-        self._text_frame = ctk.CTkFrame(self, fg_color="transparent")
-        self._text_frame.pack(fill="both", expand=True, padx=5, pady=5)
-        
-        # Use CTkTextbox for better performance
+        # Text area - use CTkTextbox for better performance
         self._textbox = ctk.CTkTextbox(
-            self._text_frame,
+            self,
             fg_color=Colors.TERMINAL_BG,
             text_color=Colors.TERMINAL_FG,
-            font=(Fonts.MONO, Fonts.SIZE_SM),
-            wrap="word",
-            state="disabled"
+            font=get_font(Fonts.SIZE_SM, family=Fonts.MONO),
+            wrap="word"
         )
-        self._textbox.pack(fill="both", expand=True)
+        self._textbox.pack(fill="both", expand=True, padx=5, pady=5)
+        
+        # Textbox stays writable for the widget itself; block user edits instead
+        self._textbox.bind("<Key>", self._block_edit)
+        for sequence in ("<<Paste>>", "<<PasteSelection>>", "<<Cut>>", "<<Clear>>", "<Button-2>"):
+            self._textbox.bind(sequence, lambda e: "break")
         
         # Configure tags for colored output
         self._configure_tags()
@@ -101,6 +128,14 @@ class TerminalWidget(ctk.CTkFrame):
         # Note: CTkTextbox has limited tag support, using prefix coloring
         pass
     
+    def _block_edit(self, event):
+        """Allow navigation and copy shortcuts, swallow anything that edits"""
+        if event.keysym in self._NAV_KEYS:
+            return None
+        if event.state & 0x4 and event.keysym.lower() in ("c", "a"):
+            return None
+        return "break"
+    
     def _toggle_autoscroll(self):
         """Toggle auto-scroll behavior"""
         self._auto_scroll = self._autoscroll_var.get()
@@ -116,43 +151,77 @@ class TerminalWidget(ctk.CTkFrame):
         # Get timestamp
         timestamp = ""
         if self._show_timestamp:
-            timestamp = datetime.now().strftime("[%H:%M:%S] ")
+            lt = time.localtime()
+            timestamp = f"[{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}] "
         
-        # Get level prefix
-        level_prefixes = {
-            "DEBUG": "[DBG]",
-            "INFO": "[INF]",
-            "WARNING": "[WRN]",
-            "ERROR": "[ERR]",
-            "CRITICAL": "[CRT]",
-        }
-        prefix = level_prefixes.get(level.upper(), "[---]")
+        self._queue_line(f"{timestamp}{self._level_prefix(level)} {text}\n")
+    
+    def _level_prefix(self, level: str) -> str:
+        """Get the short prefix for a log level"""
+        # Levels normally arrive upper-case from logging
+        prefix = self._LEVEL_PREFIX.get(level)
+        if prefix is None:
+            prefix = self._LEVEL_PREFIX.get(level.upper(), "[---]")
+        return prefix
+    
+    def _queue_line(self, line: str):
+        """Queue a formatted line for the next flush"""
+        self._pending.append(line)
         
-        # Format line
-        line = f"{timestamp}{prefix} {text}\n"
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after(16, self._flush)
+    
+    def _flush(self):
+        """Insert all pending lines with a single insert, trim and scroll"""
+        self._flush_scheduled = False
+        if not self._pending:
+            return
         
-        # Enable writing
-        self._textbox.configure(state="normal")
+        count = len(self._pending)
+        lines = [self._pending.popleft() for _ in range(count)]
         
-        # Add line
-        self._textbox.insert("end", line)
-        self._line_count += 1
+        # Only follow output if the view was at the bottom before inserting
+        at_bottom = self._textbox.yview()[1] >= 1.0
         
-        # Trim if too many lines
-        if self._line_count > self._max_lines:
-            self._textbox.delete("1.0", "2.0")
-            self._line_count -= 1
+        # Add lines
+        self._textbox.insert("end", "".join(lines))
+        self._line_count += count
         
-        # Disable writing
-        self._textbox.configure(state="disabled")
+        # Let the buffer run past max_lines by the slack, then trim in one go
+        if self._line_count > self._max_lines + self._slack:
+            overflow = self._line_count - self._max_lines
+            self._textbox.delete("1.0", f"{overflow + 1}.0")
+            self._line_count -= overflow
         
         # Auto-scroll
-        if self._auto_scroll:
-            self._textbox.see("end")
+        if self._auto_scroll and at_bottom:
+            self._scroll_to_end()
+    
+    def _scroll_to_end(self):
+        """Scroll to the end at most once per SCROLL_INTERVAL"""
+        if self._see_scheduled:
+            return
+        
+        elapsed = time.monotonic() - self._last_see
+        if elapsed >= self.SCROLL_INTERVAL:
+            self._see_end()
+        else:
+            # Trailing scroll so the last burst still ends up in view
+            self._see_scheduled = True
+            delay = int((self.SCROLL_INTERVAL - elapsed) * 1000) + 1
+            self.after(delay, self._see_end)
+    
+    def _see_end(self):
+        """Scroll the textbox to its last line"""
+        self._see_scheduled = False
+        self._last_see = time.monotonic()
+        self._textbox.see("end")
     
     def write_log(self, entry: LogEntry):
-        """Write a LogEntry to terminal"""
-        self.write(entry.message, entry.level)
+        """Write a LogEntry to terminal, reusing its own timestamp"""
+        timestamp = f"[{entry.formatted_time}] " if self._show_timestamp else ""
+        self._queue_line(f"{timestamp}{self._level_prefix(entry.level)} {entry.message}\n")
     
     def writeln(self, text: str, level: str = "INFO"):
         """Write a line (alias for write)"""
@@ -176,13 +245,13 @@ class TerminalWidget(ctk.CTkFrame):
     
     def clear(self):
         """Clear terminal content"""
-        self._textbox.configure(state="normal")
+        self._pending.clear()
         self._textbox.delete("1.0", "end")
-        self._textbox.configure(state="disabled")
         self._line_count = 0
     
     def get_content(self) -> str:
         """Get all terminal content"""
+        self._flush()
         return self._textbox.get("1.0", "end")
 
 
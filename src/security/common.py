@@ -3,36 +3,46 @@ WiFi Tester Pro v6.0 - Common Security Module
 Cross-platform security analysis and vulnerability assessment
 """
 
+import re
 import time
-from typing import List, Optional, Dict, Any
-from dataclasses import dataclass, field
-from enum import Enum, auto
+from typing import List, Optional, Dict, Any, Sequence
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from enum import IntEnum
 
 from ..settings import NetworkInfo, SecurityLevel
 
 
-class VulnerabilitySeverity(Enum):
+class VulnerabilitySeverity(IntEnum):
     """Vulnerability severity levels"""
-    INFO = auto()
-    LOW = auto()
-    MEDIUM = auto()
-    HIGH = auto()
-    CRITICAL = auto()
+    INFO = 0
+    LOW = 1
+    MEDIUM = 2
+    HIGH = 3
+    CRITICAL = 4
     
     @property
     def color(self) -> str:
         """Get color code for severity"""
-        colors = {
-            VulnerabilitySeverity.INFO: "#3498DB",
-            VulnerabilitySeverity.LOW: "#2ECC71",
-            VulnerabilitySeverity.MEDIUM: "#F39C12",
-            VulnerabilitySeverity.HIGH: "#E67E22",
-            VulnerabilitySeverity.CRITICAL: "#E74C3C",
-        }
-        return colors.get(self, "#FFFFFF")
+        return _SEVERITY_COLORS[self]
 
 
-@dataclass
+# Indexed by VulnerabilitySeverity value
+_SEVERITY_COLORS = ("#3498DB", "#2ECC71", "#F39C12", "#E67E22", "#E74C3C")
+_SEVERITY_PENALTY = (0, 5, 10, 15, 25)
+
+# Appended to every report's recommendations
+_ALWAYS_RECOMMENDATIONS = (
+    "Regularly update router firmware.",
+    "Use strong, unique passwords.",
+    "Enable network logging if available.",
+)
+
+# 2.4 GHz channels other than the non-overlapping 1, 6 and 11
+_OVERLAPPING_CHANNELS = frozenset({2, 3, 4, 5, 7, 8, 9, 10})
+
+
+@dataclass(slots=True, frozen=True)
 class Vulnerability:
     """Represents a security vulnerability"""
     id: str
@@ -42,12 +52,12 @@ class Vulnerability:
     category: str = "General"
     cve: str = ""
     recommendation: str = ""
-    references: List[str] = field(default_factory=list)
+    references: Sequence[str] = ()
     affected_network: Optional[str] = None  # BSSID
-    detected_at: float = field(default_factory=time.time)
+    detected_at: float = 0.0  # Stamped from the report when found
 
 
-@dataclass
+@dataclass(slots=True)
 class VulnerabilityReport:
     """Security scan report"""
     target_bssid: str
@@ -57,38 +67,195 @@ class VulnerabilityReport:
     vulnerabilities: List[Vulnerability] = field(default_factory=list)
     recommendations: List[str] = field(default_factory=list)
     security_score: int = 100  # 0-100
+    _severity_counts: Dict[VulnerabilitySeverity, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self):
+        """Seed severity counts from any initial vulnerabilities"""
+        self._severity_counts = {severity: 0 for severity in VulnerabilitySeverity}
+        for vuln in self.vulnerabilities:
+            self._severity_counts[vuln.severity] += 1
     
     @property
     def critical_count(self) -> int:
-        return len([v for v in self.vulnerabilities if v.severity == VulnerabilitySeverity.CRITICAL])
+        return self._severity_counts[VulnerabilitySeverity.CRITICAL]
     
     @property
     def high_count(self) -> int:
-        return len([v for v in self.vulnerabilities if v.severity == VulnerabilitySeverity.HIGH])
+        return self._severity_counts[VulnerabilitySeverity.HIGH]
     
     @property
     def medium_count(self) -> int:
-        return len([v for v in self.vulnerabilities if v.severity == VulnerabilitySeverity.MEDIUM])
+        return self._severity_counts[VulnerabilitySeverity.MEDIUM]
     
     @property
     def low_count(self) -> int:
-        return len([v for v in self.vulnerabilities if v.severity == VulnerabilitySeverity.LOW])
+        return self._severity_counts[VulnerabilitySeverity.LOW]
     
     def add_vulnerability(self, vuln: Vulnerability):
         """Add vulnerability and update score"""
         self.vulnerabilities.append(vuln)
+        self._severity_counts[vuln.severity] += 1
         
         # Update security score based on severity
-        severity_penalty = {
-            VulnerabilitySeverity.CRITICAL: 25,
-            VulnerabilitySeverity.HIGH: 15,
-            VulnerabilitySeverity.MEDIUM: 10,
-            VulnerabilitySeverity.LOW: 5,
-            VulnerabilitySeverity.INFO: 0,
-        }
-        
-        penalty = severity_penalty.get(vuln.severity, 0)
-        self.security_score = max(0, self.security_score - penalty)
+        self.security_score = max(0, self.security_score - _SEVERITY_PENALTY[vuln.severity])
+
+
+# Finding templates - only the affected network, detection time and the
+# odd description vary between scans
+
+_VULN_OPEN_NETWORK = Vulnerability(
+    id="OPEN_NETWORK",
+    name="Open Network (No Encryption)",
+    description="Network has no encryption. All traffic is visible to anyone nearby.",
+    severity=VulnerabilitySeverity.CRITICAL,
+    category="Encryption",
+    recommendation="Enable WPA2 or WPA3 encryption immediately.",
+)
+
+_VULN_WEP_ENCRYPTION = Vulnerability(
+    id="WEP_ENCRYPTION",
+    name="WEP Encryption (Deprecated)",
+    description="WEP encryption is severely broken and can be cracked in minutes.",
+    severity=VulnerabilitySeverity.CRITICAL,
+    category="Encryption",
+    cve="CVE-2001-0131",
+    recommendation="Upgrade to WPA2 or WPA3 encryption.",
+)
+
+_VULN_WPA_ENCRYPTION = Vulnerability(
+    id="WPA_ENCRYPTION",
+    name="WPA Encryption (Outdated)",
+    description="WPA1 has known vulnerabilities and should be upgraded.",
+    severity=VulnerabilitySeverity.HIGH,
+    category="Encryption",
+    recommendation="Upgrade to WPA2 or WPA3 encryption.",
+)
+
+_VULN_WPA2_TKIP = Vulnerability(
+    id="WPA2_TKIP",
+    name="WPA2 with TKIP (Weak)",
+    description="TKIP cipher has known weaknesses. AES/CCMP is recommended.",
+    severity=VulnerabilitySeverity.MEDIUM,
+    category="Encryption",
+    recommendation="Configure WPA2 to use AES/CCMP cipher only.",
+)
+
+_VULN_WPA2_PMKID = Vulnerability(
+    id="WPA2_PMKID",
+    name="WPA2 PMKID Attack Possible",
+    description="WPA2 networks may be vulnerable to offline PMKID attacks.",
+    severity=VulnerabilitySeverity.LOW,
+    category="Encryption",
+    cve="CVE-2018-14847",
+    recommendation="Use strong, complex passwords and consider WPA3.",
+)
+
+_VULN_WPA3_GOOD = Vulnerability(
+    id="WPA3_GOOD",
+    name="WPA3 Encryption (Strong)",
+    description="WPA3 provides strong encryption with SAE key exchange.",
+    severity=VulnerabilitySeverity.INFO,
+    category="Encryption",
+    recommendation="Maintain WPA3 configuration.",
+)
+
+_VULN_WPS_ENABLED = Vulnerability(
+    id="WPS_ENABLED",
+    name="WPS Enabled",
+    description="WPS PIN can be brute-forced, allowing network access.",
+    severity=VulnerabilitySeverity.HIGH,
+    category="Authentication",
+    cve="CVE-2011-5053",
+    recommendation="Disable WPS in router settings.",
+)
+
+_VULN_SIGNAL_TOO_STRONG = Vulnerability(
+    id="SIGNAL_TOO_STRONG",
+    name="Excessive Signal Strength",
+    description="Strong signal extends beyond intended area, increasing attack surface.",
+    severity=VulnerabilitySeverity.LOW,
+    category="Physical Security",
+    recommendation="Reduce transmit power to limit coverage area.",
+)
+
+_VULN_HIDDEN_SSID = Vulnerability(
+    id="HIDDEN_SSID",
+    name="Hidden SSID (False Security)",
+    description="Hidden SSIDs provide no real security and are easily discovered.",
+    severity=VulnerabilitySeverity.INFO,
+    category="Misconfiguration",
+    recommendation="Hidden SSIDs don't improve security. Focus on strong encryption.",
+)
+
+_VULN_CHANNEL_OVERLAP = Vulnerability(
+    id="CHANNEL_OVERLAP",
+    name="Overlapping Channel",
+    description="Channel overlaps with adjacent channels.",
+    severity=VulnerabilitySeverity.INFO,
+    category="Configuration",
+    recommendation="Use non-overlapping channels: 1, 6, or 11 for 2.4GHz.",
+)
+
+
+def _found(prototype: Vulnerability, network: NetworkInfo,
+           report: VulnerabilityReport, **changes) -> Vulnerability:
+    """Stamp a prototype with the network and scan time"""
+    return replace(prototype, affected_network=network.bssid,
+                   detected_at=report.scan_started, **changes)
+
+
+# Encryption classification - one regex pass sets a token bitmask which
+# indexes a precomputed finding table
+_ENCRYPTION_TOKENS = re.compile(r'OPEN|WEP|WPA3|WPA2|WPA|TKIP')
+_TOKEN_BITS = {'OPEN': 1, 'WEP': 2, 'WPA': 4, 'WPA2': 8, 'WPA3': 16, 'TKIP': 32}
+_NO_SECURITY = frozenset({'', 'NONE'})
+
+
+def _classify_encryption(mask: int) -> Optional[Vulnerability]:
+    """Pick the encryption finding for a token bitmask"""
+    if mask & 1:
+        return _VULN_OPEN_NETWORK
+    if mask & 2:
+        return _VULN_WEP_ENCRYPTION
+    if mask & 8:
+        return _VULN_WPA2_TKIP if mask & 32 else _VULN_WPA2_PMKID
+    if mask & 16:
+        return _VULN_WPA3_GOOD
+    if mask & 4:
+        return _VULN_WPA_ENCRYPTION
+    return None
+
+
+_ENCRYPTION_FINDINGS = tuple(_classify_encryption(mask) for mask in range(64))
+
+
+@lru_cache(maxsize=128)
+def _encryption_finding(security: str) -> Optional[Vulnerability]:
+    """Encryption finding for a raw security string"""
+    if not security:
+        return _VULN_OPEN_NETWORK
+    
+    security = security.upper()
+    if security in _NO_SECURITY:
+        return _VULN_OPEN_NETWORK
+    
+    mask = 0
+    for token in _ENCRYPTION_TOKENS.findall(security):
+        mask |= _TOKEN_BITS[token]
+    return _ENCRYPTION_FINDINGS[mask]
+
+
+# Simple checks as (predicate, finding, optional description builder),
+# applied in order after the encryption check
+_RULES = (
+    (lambda n: n.wps, _VULN_WPS_ENABLED, None),
+    (lambda n: n.signal >= -30, _VULN_SIGNAL_TOO_STRONG, None),
+    (lambda n: n.hidden, _VULN_HIDDEN_SSID, None),
+    (lambda n: n.channel in _OVERLAPPING_CHANNELS, _VULN_CHANNEL_OVERLAP,
+     lambda n: f"Channel {n.channel} overlaps with adjacent channels."),
+)
 
 
 class SecurityScanner:
@@ -114,30 +281,8 @@ class SecurityScanner:
         """
         self._is_scanning = True
         
-        report = VulnerabilityReport(
-            target_bssid=network.bssid,
-            target_ssid=network.ssid,
-        )
-        
         try:
-            # Check encryption type
-            self._check_encryption(network, report)
-            
-            # Check for WPS
-            self._check_wps(network, report)
-            
-            # Check signal strength issues
-            self._check_signal(network, report)
-            
-            # Check for hidden SSID
-            self._check_hidden_ssid(network, report)
-            
-            # Check channel congestion
-            self._check_channel(network, report)
-            
-            # Generate recommendations
-            self._generate_recommendations(report)
-            
+            report = self._analyze(network, time.time())
             report.scan_completed = time.time()
             self._last_report = report
             
@@ -146,131 +291,71 @@ class SecurityScanner:
         
         return report
     
-    def _check_encryption(self, network: NetworkInfo, report: VulnerabilityReport):
-        """Check encryption security"""
-        security = network.security.upper()
+    def analyze_networks(self, networks: Sequence[NetworkInfo]) -> List[VulnerabilityReport]:
+        """
+        Analyze several networks in one pass.
+        All reports share the batch's start and completion timestamps.
         
-        # Open network
-        if 'OPEN' in security or security == '' or security == 'NONE':
-            report.add_vulnerability(Vulnerability(
-                id="OPEN_NETWORK",
-                name="Open Network (No Encryption)",
-                description="Network has no encryption. All traffic is visible to anyone nearby.",
-                severity=VulnerabilitySeverity.CRITICAL,
-                category="Encryption",
-                recommendation="Enable WPA2 or WPA3 encryption immediately.",
-            ))
+        Args:
+            networks: NetworkInfo objects to analyze
         
-        # WEP encryption
-        elif 'WEP' in security:
-            report.add_vulnerability(Vulnerability(
-                id="WEP_ENCRYPTION",
-                name="WEP Encryption (Deprecated)",
-                description="WEP encryption is severely broken and can be cracked in minutes.",
-                severity=VulnerabilitySeverity.CRITICAL,
-                category="Encryption",
-                cve="CVE-2001-0131",
-                recommendation="Upgrade to WPA2 or WPA3 encryption.",
-            ))
+        Returns:
+            VulnerabilityReports in the same order as networks
+        """
+        self._is_scanning = True
         
-        # WPA (version 1)
-        elif 'WPA' in security and 'WPA2' not in security and 'WPA3' not in security:
-            report.add_vulnerability(Vulnerability(
-                id="WPA_ENCRYPTION",
-                name="WPA Encryption (Outdated)",
-                description="WPA1 has known vulnerabilities and should be upgraded.",
-                severity=VulnerabilitySeverity.HIGH,
-                category="Encryption",
-                recommendation="Upgrade to WPA2 or WPA3 encryption.",
-            ))
+        try:
+            now = time.time()
+            analyze = self._analyze
+            reports = [analyze(network, now) for network in networks]
+            
+            completed = time.time()
+            for report in reports:
+                report.scan_completed = completed
+            
+            if reports:
+                self._last_report = reports[-1]
+            
+        finally:
+            self._is_scanning = False
         
-        # WPA2 with TKIP
-        elif 'WPA2' in security and 'TKIP' in security:
-            report.add_vulnerability(Vulnerability(
-                id="WPA2_TKIP",
-                name="WPA2 with TKIP (Weak)",
-                description="TKIP cipher has known weaknesses. AES/CCMP is recommended.",
-                severity=VulnerabilitySeverity.MEDIUM,
-                category="Encryption",
-                recommendation="Configure WPA2 to use AES/CCMP cipher only.",
-            ))
+        return reports
+    
+    def _analyze(self, network: NetworkInfo, now: float) -> VulnerabilityReport:
+        """Run all checks for one network"""
+        report = VulnerabilityReport(
+            target_bssid=network.bssid,
+            target_ssid=network.ssid,
+            scan_started=now,
+        )
         
-        # WPA2 (good but check for PMKID)
-        elif 'WPA2' in security:
-            report.add_vulnerability(Vulnerability(
-                id="WPA2_PMKID",
-                name="WPA2 PMKID Attack Possible",
-                description="WPA2 networks may be vulnerable to offline PMKID attacks.",
-                severity=VulnerabilitySeverity.LOW,
-                category="Encryption",
-                cve="CVE-2018-14847",
-                recommendation="Use strong, complex passwords and consider WPA3.",
-            ))
+        # Check encryption type
+        self._check_encryption(network, report)
         
-        # WPA3 is good
-        elif 'WPA3' in security:
-            report.add_vulnerability(Vulnerability(
-                id="WPA3_GOOD",
-                name="WPA3 Encryption (Strong)",
-                description="WPA3 provides strong encryption with SAE key exchange.",
-                severity=VulnerabilitySeverity.INFO,
-                category="Encryption",
-                recommendation="Maintain WPA3 configuration.",
-            ))
-    
-    def _check_wps(self, network: NetworkInfo, report: VulnerabilityReport):
-        """Check WPS security"""
-        if network.wps:
-            report.add_vulnerability(Vulnerability(
-                id="WPS_ENABLED",
-                name="WPS Enabled",
-                description="WPS PIN can be brute-forced, allowing network access.",
-                severity=VulnerabilitySeverity.HIGH,
-                category="Authentication",
-                cve="CVE-2011-5053",
-                recommendation="Disable WPS in router settings.",
-            ))
-    
-    def _check_signal(self, network: NetworkInfo, report: VulnerabilityReport):
-        """Check signal strength issues"""
-        if network.signal >= -30:
-            report.add_vulnerability(Vulnerability(
-                id="SIGNAL_TOO_STRONG",
-                name="Excessive Signal Strength",
-                description="Strong signal extends beyond intended area, increasing attack surface.",
-                severity=VulnerabilitySeverity.LOW,
-                category="Physical Security",
-                recommendation="Reduce transmit power to limit coverage area.",
-            ))
-    
-    def _check_hidden_ssid(self, network: NetworkInfo, report: VulnerabilityReport):
-        """Check hidden SSID security theater"""
-        if network.hidden:
-            report.add_vulnerability(Vulnerability(
-                id="HIDDEN_SSID",
-                name="Hidden SSID (False Security)",
-                description="Hidden SSIDs provide no real security and are easily discovered.",
-                severity=VulnerabilitySeverity.INFO,
-                category="Misconfiguration",
-                recommendation="Hidden SSIDs don't improve security. Focus on strong encryption.",
-            ))
+        # WPS, signal strength, hidden SSID and channel checks
+        for matches, prototype, describe in _RULES:
+            if matches(network):
+                if describe is None:
+                    report.add_vulnerability(_found(prototype, network, report))
+                else:
+                    report.add_vulnerability(_found(
+                        prototype, network, report, description=describe(network)
+                    ))
+        
+        # Generate recommendations
+        self._generate_recommendations(report)
+        
+        return report
     
-    def _check_channel(self, network: NetworkInfo, report: VulnerabilityReport):
-        """Check channel configuration"""
-        # 2.4 GHz overlapping channels
-        if network.channel in [2, 3, 4, 5, 6, 7, 8, 9, 10]:
-            if network.channel not in [1, 6, 11]:
-                report.add_vulnerability(Vulnerability(
-                    id="CHANNEL_OVERLAP",
-                    name="Overlapping Channel",
-                    description=f"Channel {network.channel} overlaps with adjacent channels.",
-                    severity=VulnerabilitySeverity.INFO,
-                    category="Configuration",
-                    recommendation="Use non-overlapping channels: 1, 6, or 11 for 2.4GHz.",
-                ))
+    def _check_encryption(self, network: NetworkInfo, report: VulnerabilityReport):
+        """Check encryption security"""
+        prototype = _encryption_finding(network.security)
+        if prototype is not None:
+            report.add_vulnerability(_found(prototype, network, report))
     
     def _generate_recommendations(self, report: VulnerabilityReport):
         """Generate overall recommendations"""
+        score = report.security_score
         recommendations = []
         
         if report.critical_count > 0:
@@ -279,18 +364,14 @@ class SecurityScanner:
         if report.high_count > 0:
             recommendations.append("Address high-severity issues as soon as possible.")
         
-        if report.security_score < 50:
+        if score < 50:
             recommendations.append("Network security is poor. Major improvements needed.")
-        elif report.security_score < 75:
+        elif score < 75:
             recommendations.append("Network security is fair. Some improvements recommended.")
         else:
             recommendations.append("Network security is good. Monitor for changes.")
         
-        # Always recommend
-        recommendations.append("Regularly update router firmware.")
-        recommendations.append("Use strong, unique passwords.")
-        recommendations.append("Enable network logging if available.")
-        
+        recommendations.extend(_ALWAYS_RECOMMENDATIONS)
         report.recommendations = recommendations
     
     def get_last_report(self) -> Optional[VulnerabilityReport]:
